@@ -4148,9 +4148,11 @@ def anneal(annealTime=1.0):
       return -1
   
 def fmx_expTime_to_10MGy(beamsizeV = 3.0, beamsizeH = 5.0, vectorL = 100, energy = 12.7, wedge = 180, flux = 1e12, verbose = True):
-  if (not os.path.exists("2vb1.pdb")):
-    os.system("ln -s $CONFIGDIR/2vb1.pdb .")
-    os.system("mkdir rd3d")
+  # lexists, not exists: a dangling leftover symlink must not make
+  # os.symlink raise FileExistsError
+  if (not os.path.lexists("2vb1.pdb")):
+    os.symlink(os.path.join(os.environ["CONFIGDIR"], "2vb1.pdb"), "2vb1.pdb")
+    os.makedirs("rd3d", exist_ok=True)
   raddoseLib.fmx_expTime(beamsizeV = beamsizeV, beamsizeH = beamsizeH, vectorL = vectorL, energy = energy, wedge = wedge, flux = flux, verbose = verbose)
 #  why doesn't this work? raddoseLib.fmx_expTime_to_10MGy(beamsizeV, beamsizeH, vectorL, energy, wedge, flux, verbose)
 
@@ -1,6 +1,7 @@
+import asyncio
+import threading
+
 from config_params import GOVERNOR_TIMEOUT, LOW_MAG_GAIN, LOW_MAG_EXP_TIME, LOW_MAG_GAIN_DA, LOW_MAG_EXP_TIME_DA
-from ophyd.utils.errors import StatusTimeoutError, WaitTimeoutError
-import ophyd
 from ophyd import StatusBase
 from beamline_support import setPvValFromDescriptor as setPvDesc
 import daq_utils
@@ -8,13 +9,25 @@ from daq_utils import getBlConfig
 import logging
 logger = logging.getLogger(__name__)
 
+_gov_loop = None
+_gov_loop_lock = threading.Lock()
+
+def _getGovLoop():
+  """Lazily start the shared event loop used to await governor moves."""
+  global _gov_loop
+  with _gov_loop_lock:
+    if _gov_loop is None:
+      _gov_loop = asyncio.new_event_loop()
+      threading.Thread(target=_gov_loop.run_forever, name="govLoop", daemon=True).start()
+  return _gov_loop
+
 def set_detz_in(gov_robot, distance):
     gov_robot.dev.dz.target_In.set(distance)
 
 def set_detz_out(gov_robot, distance):
     gov_robot.dev.dz.target_Out.set(distance)
 
-def setGovRobot(gov_robot, state, wait=True):
+async def setGovRobot_async(gov_robot, state, wait=True):
   try:
     logger.info(f"setGovRobot{state}")
     if gov_robot.state.get() == state:
@@ -24,7 +37,7 @@ def setGovRobot(gov_robot, state, wait=True):
     govStatus = gov_robot.set(state)
     # TODO ophyd object should check that the request is a valid state transition
     if wait:
-      waitGov(govStatus)
+      await waitGov_async(govStatus)
     if wait and govStatus.success and gov_robot.state.get() != state:
       raise Exception(f'Did not reach expected state "{state}". actual state is "{gov_robot.state.get()}"')
     if ((wait and govStatus.success) or not wait) and state in ["SA", "DA", "DI", "SE"]:
@@ -36,15 +49,30 @@ def setGovRobot(gov_robot, state, wait=True):
     govStatus.set_exception(e)
     return govStatus
 
-def waitGov(status, timeout=GOVERNOR_TIMEOUT):
+def setGovRobot(gov_robot, state, wait=True):
+  """Sync shim for legacy callers; runs the coroutine on the shared loop."""
+  future = asyncio.run_coroutine_threadsafe(
+      setGovRobot_async(gov_robot, state, wait=wait), _getGovLoop())
+  return future.result()
+
+async def waitGov_async(status, timeout=GOVERNOR_TIMEOUT):
+  # TODO add callback for periodic updates
+  loop = asyncio.get_running_loop()
+  evt = asyncio.Event()
+  # ophyd fires status callbacks from the CA thread, so hop back onto our loop
+  status.add_callback(lambda s: loop.call_soon_threadsafe(evt.set))
   try:
-    # TODO add callback for periodic updates
-    ophyd.status.wait(status, timeout)
-  except (StatusTimeoutError, WaitTimeoutError) as e:
+    await asyncio.wait_for(evt.wait(), timeout)
+  except asyncio.TimeoutError:
     message = 'Governor Timeout!'
     logger.error(message)
     #gui_message(message)
 
+def waitGov(status, timeout=GOVERNOR_TIMEOUT):
+  future = asyncio.run_coroutine_threadsafe(
+      waitGov_async(status, timeout), _getGovLoop())
+  future.result()
+
 def waitGovNoSleep(timeout=GOVERNOR_TIMEOUT):
   pass
 
@@ -4,12 +4,14 @@ import json
 import logging
 import math
 import os
+import shutil
 import sys
 import time
 from typing import Dict, List, Optional
 
 import cv2
 import numpy as np
+import epics
 from epics import PV
 from PyMca5.PyMcaGui.physics.xrf.McaAdvancedFit import McaAdvancedFit
 from PyMca5.PyMcaGui.pymca.McaWindow import McaWindow, ScanWindow
@@ -58,11 +60,61 @@ from gui.dialog import (
 from gui.raster import RasterCell, RasterGroup
 from gui.vector import VectorMarker, VectorWidget
 from QPeriodicTable import QPeriodicTable
-from threads import RaddoseThread, ServerCheckThread, VideoThread
+from threads import RaddoseWorker, ServerCheckThread, VideoThread
 from utils import validation
 
 logger = logging.getLogger()
 
+# Minimum interval between GUI updates driven by chatty status PVs (ms)
+PV_UPDATE_COALESCE_MS = 50
+
+# The reso<->distance conversions are pure and see a small hot set of
+# argument pairs while the user types, so memoize them
+@functools.lru_cache(maxsize=128)
+def distanceFromResoCached(reso, wave):
+    return daq_utils.distance_from_reso(daq_utils.det_radius, reso, wave, 0)
+
+
+@functools.lru_cache(maxsize=128)
+def calcResoCached(dist, wave):
+    return daq_utils.calc_reso(daq_utils.det_radius, dist, wave, 0)
+
+
+# Invariant widget attributes, built once instead of per widget
+BOLD_FONT = QtGui.QFont()
+BOLD_FONT.setBold(True)
+
+ENTRY_STATE_STYLES = {
+    QtGui.QValidator.Intermediate: "QLineEdit { background-color: #fff79a }",  # yellow
+    QtGui.QValidator.Invalid: "QLineEdit { background-color: #f6989d }",  # red
+}
+ENTRY_STATE_STYLE_OK = "QLineEdit { background-color: #ffffff }"  # white
+
+_PV_CACHE: Dict[str, PV] = {}
+
+
+def getPv(name, **kw):
+    """Return a shared PV for name so repeated references reuse one CA
+    subscription instead of each holding their own monitor."""
+    pv = _PV_CACHE.get(name)
+    if pv is None:
+        pv = PV(name, **kw)
+        _PV_CACHE[name] = pv
+    return pv
+
+
+# The beamline ID is fixed for the life of the process, so resolve the
+# per-beamline limit tables and identity checks once instead of in every
+# widget builder.
+_BL = daq_utils.beamline
+_EXP = VALID_EXP_TIMES[_BL]
+_TEXP = VALID_TOTAL_EXP_TIMES[_BL]
+_TRANS = VALID_TRANSMISSION[_BL]
+_DDIST = VALID_DET_DIST[_BL]
+_IS_AMX = _BL == "amx"
+_IS_FMX = _BL == "fmx"
+_IS_NYX = _BL == "nyx"
+
 
 def get_request_object_escan(
     reqObj,
@@ -149,6 +201,9 @@ class ControlMain(QtWidgets.QMainWindow):
     lowMagCursorChangeSignal = QtCore.Signal(int, str)
     cryostreamTempSignal = QtCore.Signal(object)
     sampleZoomChangeSignal = QtCore.Signal(object)
+    raddoseRequestSignal = QtCore.Signal(object)
+    beamSizeTimerStartSignal = QtCore.Signal()
+    stillModeTimerStartSignal = QtCore.Signal()
 
     def __init__(self):
         super(ControlMain, self).__init__()
@@ -167,40 +222,70 @@ class ControlMain(QtWidgets.QMainWindow):
         self.currentRasterCellList = []
         self.redPen = QtGui.QPen(QtCore.Qt.red)
         self.bluePen = QtGui.QPen(QtCore.Qt.blue)
+        # Validators are stateless with respect to the edits they serve, so
+        # build each one once and share it across widgets
+        self.plainDoubleValidator = QtGui.QDoubleValidator()
+        self.oscRangeValidator = QtGui.QDoubleValidator(0.001, 3600, 3)
+        self.expTimeValidator = QtGui.QDoubleValidator(
+            _EXP["min"], _EXP["max"], _EXP["digits"]
+        )
+        self.totalExpTimeValidator = QtGui.QDoubleValidator(
+            _TEXP["min"], _TEXP["max"], _TEXP["digits"]
+        )
+        self.transmissionValidator = QtGui.QDoubleValidator(
+            _TRANS["min"], _TRANS["max"], _TRANS["digits"]
+        )
+        self.detDistValidator = QtGui.QDoubleValidator(
+            _DDIST["min"], _DDIST["max"], _DDIST["digits"]
+        )
         self.yellowPen = QtGui.QPen(QtCore.Qt.yellow)
         self.albulaInterface = AlbulaInterface(ip=os.environ["EIGER_DCU_IP"], 
                                                gov_message_pv_name=daq_utils.pvLookupDict["governorMessage"],)
         self.initUI()
-        self.govStateMessagePV = PV(daq_utils.pvLookupDict["governorMessage"])
-        self.zoom1FrameRatePV = PV(daq_utils.pvLookupDict["zoom1FrameRate"])
-        self.zoom2FrameRatePV = PV(daq_utils.pvLookupDict["zoom2FrameRate"])
-        self.zoom3FrameRatePV = PV(daq_utils.pvLookupDict["zoom3FrameRate"])
-        self.zoom4FrameRatePV = PV(daq_utils.pvLookupDict["zoom4FrameRate"])
-        self.sampleFluxPV = PV(daq_utils.pvLookupDict["sampleFlux"])
-        self.beamFlux_pv = PV(daq_utils.pvLookupDict["flux"])
-        self.stillMode_pv = PV(daq_utils.pvLookupDict["stillMode"])
-        self.standardMode_pv = PV(daq_utils.pvLookupDict["standardMode"])
-        self.lowMagCursorX_pv = PV(daq_utils.pvLookupDict["lowMagCursorX"])
-        self.lowMagCursorY_pv = PV(daq_utils.pvLookupDict["lowMagCursorY"])
-        self.highMagCursorX_pv = PV(daq_utils.pvLookupDict["highMagCursorX"])
-        self.highMagCursorY_pv = PV(daq_utils.pvLookupDict["highMagCursorY"])
-        self.fastShutterOpenPos_pv = PV(daq_utils.pvLookupDict["fastShutterOpenPos"])
-        self.gripTemp_pv = PV(daq_utils.pvLookupDict["gripTemp"])
+        self.govStateMessagePV = getPv(daq_utils.pvLookupDict["governorMessage"])
+        self.zoom1FrameRatePV = getPv(daq_utils.pvLookupDict["zoom1FrameRate"])
+        self.zoom2FrameRatePV = getPv(daq_utils.pvLookupDict["zoom2FrameRate"])
+        self.zoom3FrameRatePV = getPv(daq_utils.pvLookupDict["zoom3FrameRate"])
+        self.zoom4FrameRatePV = getPv(daq_utils.pvLookupDict["zoom4FrameRate"])
+        self.sampleFluxPV = getPv(daq_utils.pvLookupDict["sampleFlux"])
+        self.beamFlux_pv = getPv(daq_utils.pvLookupDict["flux"])
+        self.stillMode_pv = getPv(daq_utils.pvLookupDict["stillMode"])
+        self.standardMode_pv = getPv(daq_utils.pvLookupDict["standardMode"])
+        self.lowMagCursorX_pv = getPv(daq_utils.pvLookupDict["lowMagCursorX"])
+        self.lowMagCursorY_pv = getPv(daq_utils.pvLookupDict["lowMagCursorY"])
+        self.highMagCursorX_pv = getPv(daq_utils.pvLookupDict["highMagCursorX"])
+        self.highMagCursorY_pv = getPv(daq_utils.pvLookupDict["highMagCursorY"])
+        self.fastShutterOpenPos_pv = getPv(daq_utils.pvLookupDict["fastShutterOpenPos"])
+        self.gripTemp_pv = getPv(daq_utils.pvLookupDict["gripTemp"])
         if getBlConfig(CRYOSTREAM_ONLINE):
-            self.cryostreamTemp_pv = PV(cryostreamTempPV[daq_utils.beamline])
-        if daq_utils.beamline == "fmx":
-            self.slit1XGapSP_pv = PV(daq_utils.motor_dict["slit1XGap"] + ".VAL")
-            self.slit1YGapSP_pv = PV(daq_utils.motor_dict["slit1YGap"] + ".VAL")
+            self.cryostreamTemp_pv = getPv(cryostreamTempPV[daq_utils.beamline])
+        if _IS_FMX:
+            self.slit1XGapSP_pv = getPv(daq_utils.motor_dict["slit1XGap"] + ".VAL")
+            self.slit1YGapSP_pv = getPv(daq_utils.motor_dict["slit1YGap"] + ".VAL")
         ringCurrentPvName = "SR:C03-BI{DCCT:1}I:Real-I"
-        self.ringCurrent_pv = PV(ringCurrentPvName)
+        self.ringCurrent_pv = getPv(ringCurrentPvName)
 
-        self.beamAvailable_pv = PV(daq_utils.pvLookupDict["beamAvailable"])
-        self.sampleExposed_pv = PV(daq_utils.pvLookupDict["exposing"])
+        self.beamAvailable_pv = getPv(daq_utils.pvLookupDict["beamAvailable"])
+        self.sampleExposed_pv = getPv(daq_utils.pvLookupDict["exposing"])
 
-        self.beamSize_pv = PV(daq_utils.beamlineComm + "size_mode")
-        self.energy_pv = PV(daq_utils.motor_dict["energy"] + ".RBV")
+        self.beamSize_pv = getPv(daq_utils.beamlineComm + "size_mode")
+        self.energy_pv = getPv(daq_utils.motor_dict["energy"] + ".RBV")
         self.rasterStepDefs = {"Coarse": 20.0, "Fine": 10.0, "VFine": 5.0}
 
+        # Wavelength cache keyed on the energy line edit's text - energy
+        # changes far less often than the resolution/distance edits fire
+        self._cachedEnergyText = None
+        self._cachedWave = None
+
+        # Coalesce the total-exposure recomputation so fast typing in the
+        # oscillation/exposure edits triggers it once, not per keystroke.
+        # Every source that fired in the window is kept so source-gated
+        # side effects (the still/standard mode puts) are not dropped
+        self._totalExpSources = set()
+        self._totalExpTimer = QTimer(self)
+        self._totalExpTimer.setSingleShot(True)
+        self._totalExpTimer.timeout.connect(self.recomputeTotalExp)
+
         # Timer that waits for a second before calling raddose 3d
         # This is to prevent multiple calls when transmission textbox is changing
         self.raddoseTimer = QTimer()
@@ -208,6 +293,21 @@ class ControlMain(QtWidgets.QMainWindow):
         self.raddoseTimer.setInterval(1000)
         self.raddoseTimer.timeout.connect(self.spawnRaddoseThread)
 
+        # One long-lived worker thread for the lifetime estimates instead of
+        # a fresh QThread per recalculation; latest request wins
+        if not _IS_AMX:  # amx reads the lifetime from a PV instead
+            self.ensureRaddoseWorkdir()
+        self.raddoseWorker = RaddoseWorker()
+        self.raddoseWorkerThread = QtCore.QThread()
+        self.raddoseWorker.moveToThread(self.raddoseWorkerThread)
+        self.raddoseRequestSignal.connect(
+            self.raddoseWorker.process, QtCore.Qt.QueuedConnection
+        )
+        self.raddoseWorker.lifetime.connect(
+            self.setLifetimeCB, QtCore.Qt.QueuedConnection
+        )
+        self.raddoseWorkerThread.start()
+
         self.vector_widget = VectorWidget(main_window=self)
         self.createSampleTab()
         self.userScreenDialog = UserScreenDialog(self)
@@ -230,7 +330,7 @@ class ControlMain(QtWidgets.QMainWindow):
                 "fineZ": self.sampFineZ_pv.get(),
             }
         self.staffScreenDialog = StaffScreenDialog(self, show=False)
-        if daq_utils.beamline == "nyx":  # requires staffScreenDialog to be present
+        if _IS_NYX:  # requires staffScreenDialog to be present
             self.staffScreenDialog.fastDPCheckBox.setDisabled(True)
 
         if self.mountedPin_pv.get() == "":
@@ -265,21 +365,27 @@ class ControlMain(QtWidgets.QMainWindow):
         for item, value in values.items():
             logger.info("resetting %s to %s" % (item, value))
             if item == "osc_start":
-                self.osc_start_ledit.setText("%.3f" % float(value))
+                widget, text = self.osc_start_ledit, "%.3f" % float(value)
             elif item == "osc_end":
-                self.osc_end_ledit.setText("%.3f" % float(value))
+                widget, text = self.osc_end_ledit, "%.3f" % float(value)
             elif item == "osc_range":
-                self.osc_range_ledit.setText("%.3f" % float(value))
+                widget, text = self.osc_range_ledit, "%.3f" % float(value)
             elif item == "img_width":
-                self.img_width_ledit.setText("%.3f" % float(value))
+                widget, text = self.img_width_ledit, "%.3f" % float(value)
             elif item == "exp_time":
-                self.exp_time_ledit.setText("%.3f" % float(value))
+                widget, text = self.exp_time_ledit, "%.3f" % float(value)
             elif item == "transmission":
-                self.transmission_ledit.setText("%.3f" % float(value))
+                widget, text = self.transmission_ledit, "%.3f" % float(value)
             elif item == "resolution":
-                self.resolution_ledit.setText("%.2f" % float(value))
+                widget, text = self.resolution_ledit, "%.2f" % float(value)
             else:
                 logger.error("setGuiValues unknown item: %s value: %s" % (item, value))
+                continue
+            # skip widgets already showing the formatted value so a GUI
+            # reset doesn't re-fire the whole textChanged cascade
+            if widget.text() == text:
+                continue
+            widget.setText(text)
 
     def parseXRFTable(self):
         XRFFile = open(os.environ["CONFIGDIR"] + "/XRF-AMX_simple.txt")
@@ -306,6 +412,19 @@ class ControlMain(QtWidgets.QMainWindow):
         self.captureLowMagZoom = cv2.VideoCapture(daq_utils.lowMagZoomCamURL)
         logger.debug('lowMagZoomCamURL: "' + daq_utils.lowMagZoomCamURL + '"')
 
+    def buildColLabel(self, text, width=140):
+        label = QtWidgets.QLabel(text)
+        label.setFixedWidth(width)
+        label.setAlignment(QtCore.Qt.AlignCenter)
+        return label
+
+    def buildLineEdit(self, validator=None, width=60):
+        ledit = QtWidgets.QLineEdit()
+        ledit.setFixedWidth(width)
+        if validator is not None:
+            ledit.setValidator(validator)
+        return ledit
+
     def createSampleTab(self):
         sampleTab = QtWidgets.QWidget()
         splitter1 = QtWidgets.QSplitter(Qt.Horizontal)
@@ -411,36 +530,24 @@ class ControlMain(QtWidgets.QMainWindow):
         colParamsGB.setTitle("Acquisition")
         vBoxColParams1 = QtWidgets.QVBoxLayout()
         hBoxColParams1 = QtWidgets.QHBoxLayout()
-        colStartLabel = QtWidgets.QLabel("Oscillation Start:")
-        colStartLabel.setFixedWidth(140)
-        colStartLabel.setAlignment(QtCore.Qt.AlignCenter)
-        self.osc_start_ledit = QtWidgets.QLineEdit()
+        colStartLabel = self.buildColLabel("Oscillation Start:")
+        self.osc_start_ledit = self.buildLineEdit(self.plainDoubleValidator)
         self.setGuiValues({"osc_start": "0.0"})
-        self.osc_start_ledit.setFixedWidth(60)
-        self.osc_start_ledit.setValidator(QtGui.QDoubleValidator())
-        self.colEndLabel = QtWidgets.QLabel("Oscillation Range:")
-        self.colEndLabel.setAlignment(QtCore.Qt.AlignCenter)
-        self.colEndLabel.setFixedWidth(140)
-        self.osc_end_ledit = QtWidgets.QLineEdit()
+        self.colEndLabel = self.buildColLabel("Oscillation Range:")
+        self.osc_end_ledit = self.buildLineEdit(self.plainDoubleValidator)
         self.setGuiValues({"osc_end": "180.0"})
-        self.osc_end_ledit.setFixedWidth(60)
-        self.osc_end_ledit.setValidator(QtGui.QDoubleValidator())
         self.osc_end_ledit.textChanged[str].connect(
             functools.partial(self.totalExpChanged, "oscEnd")
         )
-        if daq_utils.beamline == "fmx":
+        if _IS_FMX:
             self.osc_end_ledit.textChanged.connect(self.calcLifetimeCB)
         hBoxColParams1.addWidget(colStartLabel)
         hBoxColParams1.addWidget(self.osc_start_ledit)
         hBoxColParams1.addWidget(self.colEndLabel)
         hBoxColParams1.addWidget(self.osc_end_ledit)
         hBoxColParams2 = QtWidgets.QHBoxLayout()
-        colRangeLabel = QtWidgets.QLabel("Oscillation Width:")
-        colRangeLabel.setFixedWidth(140)
-        colRangeLabel.setAlignment(QtCore.Qt.AlignCenter)
-        self.osc_range_ledit = QtWidgets.QLineEdit()
-        self.osc_range_ledit.setFixedWidth(60)
-        self.osc_range_ledit.setValidator(QtGui.QDoubleValidator(0.001, 3600, 3))
+        colRangeLabel = self.buildColLabel("Oscillation Width:")
+        self.osc_range_ledit = self.buildLineEdit(self.oscRangeValidator)
         self.stillModeCheckBox = QCheckBox("Stills")
         self.stillModeCheckBox.setEnabled(False)
         if self.stillModeStatePV.get():
@@ -450,23 +557,13 @@ class ControlMain(QtWidgets.QMainWindow):
         else:
             self.stillModeCheckBox.setChecked(False)
             self.osc_range_ledit.setEnabled(True)
-        colExptimeLabel = QtWidgets.QLabel("ExposureTime:")
+        colExptimeLabel = self.buildColLabel("ExposureTime:")
         self.stillModeCheckBox.clicked.connect(self.stillModeUserPushCB)
         self.osc_range_ledit.textChanged[str].connect(
             functools.partial(self.totalExpChanged, "oscRange")
         )
-        colExptimeLabel.setFixedWidth(140)
-        colExptimeLabel.setAlignment(QtCore.Qt.AlignCenter)
-        self.exp_time_ledit = QtWidgets.QLineEdit()
-        self.exp_time_ledit.setFixedWidth(60)
+        self.exp_time_ledit = self.buildLineEdit(self.expTimeValidator)
         self.exp_time_ledit.textChanged[str].connect(self.totalExpChanged)
-        self.exp_time_ledit.setValidator(
-            QtGui.QDoubleValidator(
-                VALID_EXP_TIMES[daq_utils.beamline]["min"],
-                VALID_EXP_TIMES[daq_utils.beamline]["max"],
-                VALID_EXP_TIMES[daq_utils.beamline]["digits"],
-            )
-        )
         self.exp_time_ledit.textChanged.connect(self.checkEntryState)
         hBoxColParams2.addWidget(colRangeLabel)
         hBoxColParams2.addWidget(self.osc_range_ledit)
@@ -475,24 +572,14 @@ class ControlMain(QtWidgets.QMainWindow):
         hBoxColParams2.addWidget(self.exp_time_ledit)
         hBoxColParams25 = QtWidgets.QHBoxLayout()
         hBoxColParams25.addWidget(self.stillModeCheckBox)
-        totalExptimeLabel = QtWidgets.QLabel("Total Exposure Time (s):")
-        totalExptimeLabel.setFixedWidth(155)
-        totalExptimeLabel.setAlignment(QtCore.Qt.AlignCenter)
-        self.totalExptime_ledit = QtWidgets.QLineEdit()
+        totalExptimeLabel = self.buildColLabel("Total Exposure Time (s):", width=155)
+        self.totalExptime_ledit = self.buildLineEdit(self.totalExpTimeValidator)
         self.totalExptime_ledit.setReadOnly(True)
         self.totalExptime_ledit.setFrame(False)
-        self.totalExptime_ledit.setFixedWidth(60)
-        self.totalExptime_ledit.setValidator(
-            QtGui.QDoubleValidator(
-                VALID_TOTAL_EXP_TIMES[daq_utils.beamline]["min"],
-                VALID_TOTAL_EXP_TIMES[daq_utils.beamline]["max"],
-                VALID_TOTAL_EXP_TIMES[daq_utils.beamline]["digits"],
-            )
-        )
         self.totalExptime_ledit.textChanged.connect(self.checkEntryState)
 
         sampleLifetimeLabel = QtWidgets.QLabel("Estimated Sample Lifetime (s): ")
-        if daq_utils.beamline == "amx":
+        if _IS_AMX:
             self.sampleLifetimeReadback = QtEpicsPVLabel(
                 daq_utils.pvLookupDict["sampleLifetime"], self, 70, 2
             )
@@ -504,7 +591,7 @@ class ControlMain(QtWidgets.QMainWindow):
             self.calcLifetimeCB()
         hBoxColParams25.addWidget(totalExptimeLabel)
         hBoxColParams25.addWidget(self.totalExptime_ledit)
-        # if (daq_utils.beamline == "fmx"):
+        # if (_IS_FMX):
         #  hBoxColParams25.addWidget(calcLifetimeButton)
         hBoxColParams25.addWidget(sampleLifetimeLabel)
         hBoxColParams25.addWidget(self.sampleLifetimeReadback_ledit)
@@ -542,16 +629,10 @@ class ControlMain(QtWidgets.QMainWindow):
         transmisionSPLabel = QtWidgets.QLabel("SetPoint:")
 
         self.transmission_ledit = self.transmissionSetPoint.getEntry()
-        self.transmission_ledit.setValidator(
-            QtGui.QDoubleValidator(
-                VALID_TRANSMISSION[daq_utils.beamline]["min"],
-                VALID_TRANSMISSION[daq_utils.beamline]["max"],
-                VALID_TRANSMISSION[daq_utils.beamline]["digits"],
-            )
-        )
+        self.transmission_ledit.setValidator(self.transmissionValidator)
         self.setGuiValues({"transmission": getBlConfig("stdTrans")})
         self.transmission_ledit.returnPressed.connect(self.setTransCB)
-        if daq_utils.beamline == "fmx":
+        if _IS_FMX:
             self.transmission_ledit.textChanged.connect(self.calcLifetimeCB)
         setTransButton = QtWidgets.QPushButton("Set Trans")
         setTransButton.clicked.connect(self.setTransCB)
@@ -560,7 +641,7 @@ class ControlMain(QtWidgets.QMainWindow):
         self.beamsizeComboBox.addItems(BEAMSIZE_OPTIONS.keys())
         self.beamsizeComboBox.setCurrentIndex(int(self.beamSize_pv.get()))
         self.beamsizeComboBox.activated[str].connect(self.beamsizeComboActivatedCB)
-        if daq_utils.beamline == "amx" or self.energy_pv.get() < 9000:
+        if _IS_AMX or self.energy_pv.get() < 9000:
             self.beamsizeComboBox.setEnabled(False)
         hBoxColParams3 = QtWidgets.QHBoxLayout()
         colEnergyLabel = QtWidgets.QLabel("Energy (eV):")
@@ -574,14 +655,14 @@ class ControlMain(QtWidgets.QMainWindow):
             daq_utils.motor_dict["energy"] + ".VAL", self, 75, 2
         )
         self.energy_ledit = self.energyMoveLedit.getEntry()
-        self.energy_ledit.setValidator(QtGui.QDoubleValidator())
+        self.energy_ledit.setValidator(self.plainDoubleValidator)
         self.energy_ledit.returnPressed.connect(self.moveEnergyMaxDeltaCB)
         moveEnergyButton = QtWidgets.QPushButton("Move Energy")
         moveEnergyButton.clicked.connect(self.moveEnergyCB)
         hBoxColParams3.addWidget(colEnergyLabel)
         hBoxColParams3.addWidget(self.energyReadback)
         hBoxColParams3.addWidget(energySPLabel)
-        if daq_utils.beamline == "fmx":
+        if _IS_FMX:
             if getBlConfig(SET_ENERGY_CHECK):
                 hBoxColParams3.addWidget(moveEnergyButton)
             else:
@@ -597,16 +678,10 @@ class ControlMain(QtWidgets.QMainWindow):
         hBoxColParams22.addWidget(beamsizeLabel)
         hBoxColParams22.addWidget(self.beamsizeComboBox)
         hBoxColParams4 = QtWidgets.QHBoxLayout()
-        colBeamWLabel = QtWidgets.QLabel("Beam Width:")
-        colBeamWLabel.setFixedWidth(140)
-        colBeamWLabel.setAlignment(QtCore.Qt.AlignCenter)
-        self.beamWidth_ledit = QtWidgets.QLineEdit()
-        self.beamWidth_ledit.setFixedWidth(60)
-        colBeamHLabel = QtWidgets.QLabel("Beam Height:")
-        colBeamHLabel.setFixedWidth(140)
-        colBeamHLabel.setAlignment(QtCore.Qt.AlignCenter)
-        self.beamHeight_ledit = QtWidgets.QLineEdit()
-        self.beamHeight_ledit.setFixedWidth(60)
+        colBeamWLabel = self.buildColLabel("Beam Width:")
+        self.beamWidth_ledit = self.buildLineEdit()
+        colBeamHLabel = self.buildColLabel("Beam Height:")
+        self.beamHeight_ledit = self.buildLineEdit()
         hBoxColParams4.addWidget(colBeamWLabel)
         hBoxColParams4.addWidget(self.beamWidth_ledit)
         hBoxColParams4.addWidget(colBeamHLabel)
@@ -614,11 +689,9 @@ class ControlMain(QtWidgets.QMainWindow):
         hBoxColParams5 = QtWidgets.QHBoxLayout()
         colResoLabel = QtWidgets.QLabel("Edge Resolution:")
         colResoLabel.setAlignment(QtCore.Qt.AlignCenter)
-        self.resolution_ledit = QtWidgets.QLineEdit()
-        self.resolution_ledit.setFixedWidth(60)
-        self.resolution_ledit.setValidator(QtGui.QDoubleValidator())
+        self.resolution_ledit = self.buildLineEdit(self.plainDoubleValidator)
         self.resolution_ledit.textEdited[str].connect(self.resoTextChanged)
-        if daq_utils.beamline == "nyx":
+        if _IS_NYX:
             self.resolution_ledit.setEnabled(False)
         detDistLabel = QtWidgets.QLabel("Detector Dist.")
         detDistLabel.setAlignment(QtCore.Qt.AlignCenter)
@@ -631,13 +704,7 @@ class ControlMain(QtWidgets.QMainWindow):
         self.detDistMotorEntry = QtEpicsPVEntry(
             daq_utils.motor_dict["detectorDist"] + ".VAL", self, 70, 2
         )
-        self.detDistMotorEntry.getEntry().setValidator(
-            QtGui.QDoubleValidator(
-                VALID_DET_DIST[daq_utils.beamline]["min"],
-                VALID_DET_DIST[daq_utils.beamline]["max"],
-                VALID_DET_DIST[daq_utils.beamline]["digits"],
-            )
-        )
+        self.detDistMotorEntry.getEntry().setValidator(self.detDistValidator)
         self.detDistMotorEntry.getEntry().textChanged[str].connect(
             self.detDistTextChanged
         )
@@ -659,39 +726,31 @@ class ControlMain(QtWidgets.QMainWindow):
         self.centeringComboBox = QtWidgets.QComboBox(self)
         self.centeringComboBox.addItems(centeringOptionList)
         protoLabel = QtWidgets.QLabel("Protocol:")
-        font = QtGui.QFont()
-        font.setBold(True)
-        protoLabel.setFont(font)
+        protoLabel.setFont(BOLD_FONT)
         protoLabel.setAlignment(QtCore.Qt.AlignCenter)
         self.protoRadioGroup = QtWidgets.QButtonGroup()
         self.protoStandardRadio = QtWidgets.QRadioButton("standard")
         self.protoStandardRadio.setChecked(True)
-        self.protoStandardRadio.toggled.connect(
-            functools.partial(self.protoRadioToggledCB, "standard")
-        )
-        self.protoStandardRadio.pressed.connect(
-            functools.partial(self.protoRadioToggledCB, "standard")
-        )
         self.protoRadioGroup.addButton(self.protoStandardRadio)
         self.protoRasterRadio = QtWidgets.QRadioButton("raster")
-        self.protoRasterRadio.toggled.connect(
-            functools.partial(self.protoRadioToggledCB, "raster")
-        )
-        self.protoRasterRadio.pressed.connect(
-            functools.partial(self.protoRadioToggledCB, "raster")
-        )
         self.protoRadioGroup.addButton(self.protoRasterRadio)
         self.protoVectorRadio = QtWidgets.QRadioButton("vector")
-        self.protoRasterRadio.toggled.connect(
-            functools.partial(self.protoRadioToggledCB, "vector")
-        )
-        self.protoRasterRadio.pressed.connect(
-            functools.partial(self.protoRadioToggledCB, "vector")
-        )
         self.protoRadioGroup.addButton(self.protoVectorRadio)
         self.protoOtherRadio = QtWidgets.QRadioButton("other")
         self.protoOtherRadio.setEnabled(False)
         self.protoRadioGroup.addButton(self.protoOtherRadio)
+        # one connection for the whole group instead of toggled+pressed per
+        # button, which used to dispatch protoRadioToggledCB twice per click
+        self.protoRadioNames = {
+            self.protoStandardRadio: "standard",
+            self.protoRasterRadio: "raster",
+            self.protoVectorRadio: "vector",
+        }
+        self.protoRadioGroup.buttonClicked.connect(
+            lambda button: self.protoRadioToggledCB(
+                self.protoRadioNames.get(button, "other")
+            )
+        )
         protoOptionList = [
             "standard",
             "raster",
@@ -706,6 +765,15 @@ class ControlMain(QtWidgets.QMainWindow):
         ]  # these should probably come from db
         self.protoComboBox = QtWidgets.QComboBox(self)
         self.protoComboBox.addItems(protoOptionList)
+        self.protoComboBoxIndex = {
+            name: index for index, name in enumerate(protoOptionList)
+        }
+        # track the current protocol here so hot paths don't round-trip
+        # through Qt for currentText()
+        self.currentProtocol = protoOptionList[0]
+        self.protoComboBox.currentTextChanged.connect(
+            lambda text: setattr(self, "currentProtocol", text)
+        )
         self.protoComboBox.activated[str].connect(self.protoComboActivatedCB)
         hBoxColParams6.addWidget(protoLabel)
         hBoxColParams6.addWidget(self.protoStandardRadio)
@@ -791,62 +859,11 @@ class ControlMain(QtWidgets.QMainWindow):
         self.vBoxRasterParams.addLayout(self.hBoxRasterLayout1)
         self.vBoxRasterParams.addLayout(self.hBoxRasterLayout2)
         self.rasterParamsFrame.setLayout(self.vBoxRasterParams)
-        self.multiColParamsFrame = (
-            QFrame()
-        )  # something for criteria to decide on which hotspots to collect on for multi-xtal
-        self.hBoxMultiColParamsLayout1 = QtWidgets.QHBoxLayout()
-        self.hBoxMultiColParamsLayout1.setAlignment(QtCore.Qt.AlignLeft)
-        multiColCutoffLabel = QtWidgets.QLabel("Diffraction Cutoff")
-        multiColCutoffLabel.setFixedWidth(110)
-        self.multiColCutoffEdit = QtWidgets.QLineEdit(
-            "320"
-        )  # may need to store this in DB at some point, it's a silly number for now
-        self.multiColCutoffEdit.setFixedWidth(60)
-        self.hBoxMultiColParamsLayout1.addWidget(multiColCutoffLabel)
-        self.hBoxMultiColParamsLayout1.addWidget(self.multiColCutoffEdit)
-        self.multiColParamsFrame.setLayout(self.hBoxMultiColParamsLayout1)
-        self.characterizeParamsFrame = QFrame()
-        vBoxCharacterizeParams1 = QtWidgets.QVBoxLayout()
-        self.hBoxCharacterizeLayout1 = QtWidgets.QHBoxLayout()
-        self.characterizeTargetLabel = QtWidgets.QLabel("Characterization Targets")
-        characterizeResoLabel = QtWidgets.QLabel("Resolution")
-        characterizeResoLabel.setAlignment(QtCore.Qt.AlignCenter)
-        self.characterizeResoEdit = QtWidgets.QLineEdit("3.0")
-        characterizeISIGLabel = QtWidgets.QLabel("I/Sigma")
-        characterizeISIGLabel.setAlignment(QtCore.Qt.AlignCenter)
-        self.characterizeISIGEdit = QtWidgets.QLineEdit("2.0")
-        self.characterizeAnomCheckBox = QCheckBox("Anomolous")
-        self.characterizeAnomCheckBox.setChecked(False)
-        self.hBoxCharacterizeLayout2 = QtWidgets.QHBoxLayout()
-        characterizeCompletenessLabel = QtWidgets.QLabel("Completeness")
-        characterizeCompletenessLabel.setAlignment(QtCore.Qt.AlignCenter)
-        self.characterizeCompletenessEdit = QtWidgets.QLineEdit("0.99")
-        characterizeMultiplicityLabel = QtWidgets.QLabel("Multiplicity")
-        characterizeMultiplicityLabel.setAlignment(QtCore.Qt.AlignCenter)
-        self.characterizeMultiplicityEdit = QtWidgets.QLineEdit("auto")
-        characterizeDoseLimitLabel = QtWidgets.QLabel("Dose Limit")
-        characterizeDoseLimitLabel.setAlignment(QtCore.Qt.AlignCenter)
-        self.characterizeDoseLimitEdit = QtWidgets.QLineEdit("100")
-        characterizeSpaceGroupLabel = QtWidgets.QLabel("Space Group")
-        characterizeSpaceGroupLabel.setAlignment(QtCore.Qt.AlignCenter)
-        self.characterizeSpaceGroupEdit = QtWidgets.QLineEdit("P1")
-        self.hBoxCharacterizeLayout1.addWidget(characterizeResoLabel)
-        self.hBoxCharacterizeLayout1.addWidget(self.characterizeResoEdit)
-        self.hBoxCharacterizeLayout1.addWidget(characterizeISIGLabel)
-        self.hBoxCharacterizeLayout1.addWidget(self.characterizeISIGEdit)
-        self.hBoxCharacterizeLayout1.addWidget(characterizeSpaceGroupLabel)
-        self.hBoxCharacterizeLayout1.addWidget(self.characterizeSpaceGroupEdit)
-        self.hBoxCharacterizeLayout1.addWidget(self.characterizeAnomCheckBox)
-        self.hBoxCharacterizeLayout2.addWidget(characterizeCompletenessLabel)
-        self.hBoxCharacterizeLayout2.addWidget(self.characterizeCompletenessEdit)
-        self.hBoxCharacterizeLayout2.addWidget(characterizeMultiplicityLabel)
-        self.hBoxCharacterizeLayout2.addWidget(self.characterizeMultiplicityEdit)
-        self.hBoxCharacterizeLayout2.addWidget(characterizeDoseLimitLabel)
-        self.hBoxCharacterizeLayout2.addWidget(self.characterizeDoseLimitEdit)
-        vBoxCharacterizeParams1.addWidget(self.characterizeTargetLabel)
-        vBoxCharacterizeParams1.addLayout(self.hBoxCharacterizeLayout1)
-        vBoxCharacterizeParams1.addLayout(self.hBoxCharacterizeLayout2)
-        self.characterizeParamsFrame.setLayout(vBoxCharacterizeParams1)
+        # the multiCol and characterize frames are only needed for their own
+        # protocols, so they are built lazily on first use (see
+        # ensureMultiColParamsFrame/ensureCharacterizeParamsFrame)
+        self.multiColParamsFrame = None
+        self.characterizeParamsFrame = None
         self.vectorParamsFrame = QFrame()
         hBoxVectorLayout1 = QtWidgets.QHBoxLayout()
         setVectorStartButton = QtWidgets.QPushButton("Vector\nStart")
@@ -897,13 +914,10 @@ class ControlMain(QtWidgets.QMainWindow):
         vBoxColParams1.addLayout(hBoxColParams7)
         vBoxColParams1.addLayout(hBoxColParams6)
         vBoxColParams1.addWidget(self.rasterParamsFrame)
-        vBoxColParams1.addWidget(self.multiColParamsFrame)
         vBoxColParams1.addWidget(self.vectorParamsFrame)
-        vBoxColParams1.addWidget(self.characterizeParamsFrame)
         vBoxColParams1.addWidget(self.processingOptionsFrame)
         self.rasterParamsFrame.hide()
-        self.multiColParamsFrame.hide()
-        self.characterizeParamsFrame.hide()
+        self.colParamsLayout = vBoxColParams1
         colParamsGB.setLayout(vBoxColParams1)
         self.dataPathGB = DataLocInfo(self)
         vBoxMainColLayout.addWidget(colParamsGB)
@@ -1341,7 +1355,7 @@ class ControlMain(QtWidgets.QMainWindow):
         vBoxlayout.addWidget(splitter1)
         self.lastFileLabel2 = QtWidgets.QLabel("File:")
         self.lastFileLabel2.setFixedWidth(60)
-        if daq_utils.beamline == "amx":
+        if _IS_AMX:
             self.lastFileRBV2 = QtEpicsPVLabel(
                 "XF:17IDB-ES:AMX{Det:Eig9M}cam1:FullFileName_RBV", self, 0
             )
@@ -1387,7 +1401,7 @@ class ControlMain(QtWidgets.QMainWindow):
             self.sampleExposedLabel = QtWidgets.QLabel("Sample Not Exposed")
             self.sampleExposedLabel.setStyleSheet("background-color: #99FF66;")
         gripperLabel = QtWidgets.QLabel("Gripper Temp (K):")
-        if daq_utils.beamline == "nyx":
+        if _IS_NYX:
             self.gripperTempLabel = QtWidgets.QLabel("N/A")
         else:
             self.gripperTempLabel = QtWidgets.QLabel("%.1f" % self.gripTemp_pv.get())
@@ -1418,7 +1432,7 @@ class ControlMain(QtWidgets.QMainWindow):
         # 12/19 - uncomment this to expose the PyMCA XRF interface. It's not connected to anything.
         self.zoomLevelToggledCB("Zoom1")
 
-        if daq_utils.beamline == "nyx":  # Temporarily disabling unusued buttons on NYX
+        if _IS_NYX:  # Temporarily disabling unusued buttons on NYX
             self.protoRasterRadio.setDisabled(True)
             self.protoStandardRadio.setDisabled(True)
             self.protoVectorRadio.setDisabled(True)
@@ -1481,7 +1495,7 @@ class ControlMain(QtWidgets.QMainWindow):
             self.refreshCollectionParams(self.selectedSampleRequest)
 
     def stillModeUserPushCB(self, state):
-        logger.info("still checkbox state " + str(state))
+        logger.info(f"still checkbox state {state}")
         if self.controlEnabled():
             if state:
                 self.stillMode_pv.put(1)
@@ -1533,14 +1547,12 @@ class ControlMain(QtWidgets.QMainWindow):
             self.showProtParams()
         if self.vidActionC2CRadio.isChecked():
             self.click_positions = []
-            if (
-                self.protoComboBox.findText(str("raster"))
-                == self.protoComboBox.currentIndex()
-                or self.protoComboBox.findText(str("stepRaster"))
-                == self.protoComboBox.currentIndex()
+            if self.protoComboBox.currentIndex() in (
+                self.protoComboBoxIndex["raster"],
+                self.protoComboBoxIndex["stepRaster"],
             ):
                 self.protoComboBox.setCurrentIndex(
-                    self.protoComboBox.findText(str("standard"))
+                    self.protoComboBoxIndex["standard"]
                 )
                 self.protoComboActivatedCB("standard")
             self.showProtParams()
@@ -1728,8 +1740,7 @@ class ControlMain(QtWidgets.QMainWindow):
     def saveVidSnapshotCB(
         self, comment="", useOlog=False, reqID=None, rasterHeatJpeg=None
     ):
-        if not os.path.exists("snapshots"):
-            os.system("mkdir snapshots")
+        os.makedirs("snapshots", exist_ok=True)
         width = 640
         height = 512
         targetrect = QRectF(0, 0, width, height)
@@ -2005,7 +2016,7 @@ class ControlMain(QtWidgets.QMainWindow):
         self.vector_widget.update_vector(posRBV, motID, self.centerMarker.pos(), offset)
 
     def queueEnScanCB(self):
-        self.protoComboBox.setCurrentIndex(self.protoComboBox.findText(str("eScan")))
+        self.protoComboBox.setCurrentIndex(self.protoComboBoxIndex.get("eScan", -1))
         self.addRequestsToAllSelectedCB()
         self.treeChanged_pv.put(1)
 
@@ -2107,14 +2118,14 @@ class ControlMain(QtWidgets.QMainWindow):
         self.beamsizeComboBox.setCurrentIndex(beamSizeFlag)
 
     def processEnergyChange(self, energyVal):
-        if daq_utils.beamline != "amx":
+        if not _IS_AMX:
             if energyVal < 9000:
                 self.beamsizeComboBox.setEnabled(False)
             else:
                 self.beamsizeComboBox.setEnabled(True)
 
     def processControlMaster(self, controlPID):
-        logger.info("in callback controlPID = " + str(controlPID))
+        logger.info(f"in callback controlPID = {controlPID}")
         if abs(int(controlPID)) == self.processID:
             self.controlMasterCheckBox.setChecked(True)
         else:
@@ -2187,7 +2198,7 @@ class ControlMain(QtWidgets.QMainWindow):
             self.userScreenDialog.zebraReturnedTriggerCheckBox.setChecked(False)
 
     def processControlMasterNew(self, controlPID):
-        logger.info("in callback controlPID = " + str(controlPID))
+        logger.info(f"in callback controlPID = {controlPID}")
         if abs(int(controlPID)) != self.processID:
             self.controlMasterCheckBox.setChecked(False)
 
@@ -2227,9 +2238,7 @@ class ControlMain(QtWidgets.QMainWindow):
             self.choochF2PrimeInfl.setText(str(choochResultObj["f2prime_infl"]))
             self.choochF2PrimePeak.setText(str(choochResultObj["f2prime_peak"]))
             self.choochResultFlag_pv.put("0")
-            self.protoComboBox.setCurrentIndex(
-                self.protoComboBox.findText(str("standard"))
-            )
+            self.protoComboBox.setCurrentIndex(self.protoComboBoxIndex["standard"])
             self.protoComboActivatedCB("standard")
         except TypeError as e:
             logger.error(
@@ -2256,12 +2265,88 @@ class ControlMain(QtWidgets.QMainWindow):
                 priorityMin = orderedRequests[i]["priority"]
         return priorityMin
 
+    def ensureMultiColParamsFrame(self):
+        if self.multiColParamsFrame is not None:
+            return
+        self.multiColParamsFrame = (
+            QFrame()
+        )  # something for criteria to decide on which hotspots to collect on for multi-xtal
+        self.hBoxMultiColParamsLayout1 = QtWidgets.QHBoxLayout()
+        self.hBoxMultiColParamsLayout1.setAlignment(QtCore.Qt.AlignLeft)
+        multiColCutoffLabel = QtWidgets.QLabel("Diffraction Cutoff")
+        multiColCutoffLabel.setFixedWidth(110)
+        self.multiColCutoffEdit = QtWidgets.QLineEdit(
+            "320"
+        )  # may need to store this in DB at some point, it's a silly number for now
+        self.multiColCutoffEdit.setFixedWidth(60)
+        self.hBoxMultiColParamsLayout1.addWidget(multiColCutoffLabel)
+        self.hBoxMultiColParamsLayout1.addWidget(self.multiColCutoffEdit)
+        self.multiColParamsFrame.setLayout(self.hBoxMultiColParamsLayout1)
+        self.multiColParamsFrame.hide()
+        self.colParamsLayout.insertWidget(
+            self.colParamsLayout.indexOf(self.vectorParamsFrame),
+            self.multiColParamsFrame,
+        )
+
+    def ensureCharacterizeParamsFrame(self):
+        if self.characterizeParamsFrame is not None:
+            return
+        self.characterizeParamsFrame = QFrame()
+        vBoxCharacterizeParams1 = QtWidgets.QVBoxLayout()
+        self.hBoxCharacterizeLayout1 = QtWidgets.QHBoxLayout()
+        self.characterizeTargetLabel = QtWidgets.QLabel("Characterization Targets")
+        characterizeResoLabel = QtWidgets.QLabel("Resolution")
+        characterizeResoLabel.setAlignment(QtCore.Qt.AlignCenter)
+        self.characterizeResoEdit = QtWidgets.QLineEdit("3.0")
+        characterizeISIGLabel = QtWidgets.QLabel("I/Sigma")
+        characterizeISIGLabel.setAlignment(QtCore.Qt.AlignCenter)
+        self.characterizeISIGEdit = QtWidgets.QLineEdit("2.0")
+        self.characterizeAnomCheckBox = QCheckBox("Anomolous")
+        self.characterizeAnomCheckBox.setChecked(False)
+        self.hBoxCharacterizeLayout2 = QtWidgets.QHBoxLayout()
+        characterizeCompletenessLabel = QtWidgets.QLabel("Completeness")
+        characterizeCompletenessLabel.setAlignment(QtCore.Qt.AlignCenter)
+        self.characterizeCompletenessEdit = QtWidgets.QLineEdit("0.99")
+        characterizeMultiplicityLabel = QtWidgets.QLabel("Multiplicity")
+        characterizeMultiplicityLabel.setAlignment(QtCore.Qt.AlignCenter)
+        self.characterizeMultiplicityEdit = QtWidgets.QLineEdit("auto")
+        characterizeDoseLimitLabel = QtWidgets.QLabel("Dose Limit")
+        characterizeDoseLimitLabel.setAlignment(QtCore.Qt.AlignCenter)
+        self.characterizeDoseLimitEdit = QtWidgets.QLineEdit("100")
+        characterizeSpaceGroupLabel = QtWidgets.QLabel("Space Group")
+        characterizeSpaceGroupLabel.setAlignment(QtCore.Qt.AlignCenter)
+        self.characterizeSpaceGroupEdit = QtWidgets.QLineEdit("P1")
+        self.hBoxCharacterizeLayout1.addWidget(characterizeResoLabel)
+        self.hBoxCharacterizeLayout1.addWidget(self.characterizeResoEdit)
+        self.hBoxCharacterizeLayout1.addWidget(characterizeISIGLabel)
+        self.hBoxCharacterizeLayout1.addWidget(self.characterizeISIGEdit)
+        self.hBoxCharacterizeLayout1.addWidget(characterizeSpaceGroupLabel)
+        self.hBoxCharacterizeLayout1.addWidget(self.characterizeSpaceGroupEdit)
+        self.hBoxCharacterizeLayout1.addWidget(self.characterizeAnomCheckBox)
+        self.hBoxCharacterizeLayout2.addWidget(characterizeCompletenessLabel)
+        self.hBoxCharacterizeLayout2.addWidget(self.characterizeCompletenessEdit)
+        self.hBoxCharacterizeLayout2.addWidget(characterizeMultiplicityLabel)
+        self.hBoxCharacterizeLayout2.addWidget(self.characterizeMultiplicityEdit)
+        self.hBoxCharacterizeLayout2.addWidget(characterizeDoseLimitLabel)
+        self.hBoxCharacterizeLayout2.addWidget(self.characterizeDoseLimitEdit)
+        vBoxCharacterizeParams1.addWidget(self.characterizeTargetLabel)
+        vBoxCharacterizeParams1.addLayout(self.hBoxCharacterizeLayout1)
+        vBoxCharacterizeParams1.addLayout(self.hBoxCharacterizeLayout2)
+        self.characterizeParamsFrame.setLayout(vBoxCharacterizeParams1)
+        self.characterizeParamsFrame.hide()
+        self.colParamsLayout.insertWidget(
+            self.colParamsLayout.indexOf(self.processingOptionsFrame),
+            self.characterizeParamsFrame,
+        )
+
     def showProtParams(self):
-        protocol = str(self.protoComboBox.currentText())
+        protocol = self.currentProtocol
         self.rasterParamsFrame.hide()
-        self.characterizeParamsFrame.hide()
+        if self.characterizeParamsFrame is not None:
+            self.characterizeParamsFrame.hide()
         self.processingOptionsFrame.hide()
-        self.multiColParamsFrame.hide()
+        if self.multiColParamsFrame is not None:
+            self.multiColParamsFrame.hide()
         self.osc_start_ledit.setEnabled(True)
         self.osc_end_ledit.setEnabled(True)
         if protocol == "raster" or protocol == "rasterScreen":
@@ -2276,11 +2361,13 @@ class ControlMain(QtWidgets.QMainWindow):
             self.rasterParamsFrame.show()
             self.osc_start_ledit.setEnabled(False)
             self.osc_end_ledit.setEnabled(False)
+            self.ensureMultiColParamsFrame()
             self.multiColParamsFrame.show()
         elif protocol == "vector" or protocol == "stepVector":
             self.vectorParamsFrame.show()
             self.processingOptionsFrame.show()
         elif protocol == "characterize" or protocol == "ednaCol":
+            self.ensureCharacterizeParamsFrame()
             self.characterizeParamsFrame.show()
             self.processingOptionsFrame.show()
         elif protocol == "standard" or protocol == "burn":
@@ -2311,99 +2398,123 @@ class ControlMain(QtWidgets.QMainWindow):
         return x_vec, y_vec, z_vec, vector_length
 
     def totalExpChanged(self, text):
-        if text == "oscEnd" and daq_utils.beamline == "fmx":
+        # remember every edit that fired and let the timer coalesce the
+        # recomputation instead of redoing it per keystroke
+        self._totalExpSources.add(text)
+        self._totalExpTimer.start(50)
+
+    def setTotalExpText(self, text):
+        if self.totalExptime_ledit.text() != text:
+            self.totalExptime_ledit.setText(text)
+
+    def parseFloat(self, widget, default=0.0):
+        # validate explicitly instead of letting float() raise on the
+        # partial strings ("", "-", "1.") users type through, and parse
+        # with the validator's locale - QDoubleValidator accepts localized
+        # group/decimal separators that float() does not
+        text = widget.text()
+        if (
+            self.plainDoubleValidator.validate(text, 0)[0]
+            == QtGui.QValidator.Acceptable
+        ):
+            value, ok = self.plainDoubleValidator.locale().toDouble(text)
+            if ok:
+                return value
+        return default
+
+    def recomputeTotalExp(self):
+        sources = self._totalExpSources
+        self._totalExpSources = set()
+        if "oscEnd" in sources and _IS_FMX:
             self.sampleLifetimeReadback_ledit.setStyleSheet("color : gray")
-        try:
-            if float(str(self.osc_range_ledit.text())) == 0:
-                if text == "oscRange":
-                    if self.controlEnabled():
-                        self.stillMode_pv.put(1)
-                self.colEndLabel.setText("Number of Images: ")
-                if (
-                    str(self.protoComboBox.currentText()) != "standard"
-                    and str(self.protoComboBox.currentText()) != "vector"
-                ):
-                    self.totalExptime_ledit.setText("----")
-                else:
-                    try:
-                        totalExptime = float(self.osc_end_ledit.text()) * float(
-                            self.exp_time_ledit.text()
-                        )
-                    except ValueError:
-                        totalExptime = 0.0
-                    except TypeError:
-                        totalExptime = 0.0
-                    except ZeroDivisionError:
-                        totalExptime = 0.0
-                    self.totalExptime_ledit.setText("%.3f" % totalExptime)
-                return
+        protocol = self.currentProtocol
+        oscRange = self.parseFloat(self.osc_range_ledit, default=None)
+        if oscRange is None:
+            return
+        if oscRange == 0:
+            if "oscRange" in sources:
+                if self.controlEnabled():
+                    self.stillMode_pv.put(1)
+            self.colEndLabel.setText("Number of Images: ")
+            if protocol != "standard" and protocol != "vector":
+                self.setTotalExpText("----")
             else:
-                if text == "oscRange":
-                    if self.controlEnabled():
-                        self.standardMode_pv.put(1)
-                self.colEndLabel.setText("Oscillation Range:")
-        except ValueError:
+                totalExptime = self.parseFloat(self.osc_end_ledit) * self.parseFloat(
+                    self.exp_time_ledit
+                )
+                self.setTotalExpText("%.3f" % totalExptime)
             return
+        else:
+            if "oscRange" in sources:
+                if self.controlEnabled():
+                    self.standardMode_pv.put(1)
+            self.colEndLabel.setText("Oscillation Range:")
 
-        if (
-            str(self.protoComboBox.currentText()) != "standard"
-            and str(self.protoComboBox.currentText()) != "vector"
-        ):
-            self.totalExptime_ledit.setText("----")
+        if protocol != "standard" and protocol != "vector":
+            self.setTotalExpText("----")
         else:
-            try:
-                totalExptime = (
-                    float(self.osc_end_ledit.text())
-                    / (float(self.osc_range_ledit.text()))
-                ) * float(self.exp_time_ledit.text())
-            except ValueError:
-                totalExptime = 0.0
-            except TypeError:
-                totalExptime = 0.0
-            except ZeroDivisionError:
-                totalExptime = 0.0
-            self.totalExptime_ledit.setText("%.3f" % totalExptime)
-            if str(self.protoComboBox.currentText()) == "vector":
+            totalExptime = (
+                self.parseFloat(self.osc_end_ledit) / oscRange
+            ) * self.parseFloat(self.exp_time_ledit)
+            self.setTotalExpText("%.3f" % totalExptime)
+            if protocol == "vector":
                 try:
                     self.updateVectorLengthAndSpeed()
                 except:
                     pass
 
-            try:
-                if float(self.osc_end_ledit.text()) >= 5.0:
+            try:  # the staff dialog may not exist yet during startup
+                if self.parseFloat(self.osc_end_ledit) >= 5.0:
                     self.staffScreenDialog.fastDPCheckBox.setChecked(True)
                 else:
                     self.staffScreenDialog.fastDPCheckBox.setChecked(False)
-            except:
+            except AttributeError:
                 pass
 
+    def currentWave(self):
+        txt = self.energy_ledit.text()
+        if txt != self._cachedEnergyText:
+            if (
+                self.plainDoubleValidator.validate(txt, 0)[0]
+                != QtGui.QValidator.Acceptable
+            ):
+                return None
+            energy, ok = self.plainDoubleValidator.locale().toDouble(txt)
+            if not ok:
+                return None
+            self._cachedWave = daq_utils.energy2wave(energy)
+            self._cachedEnergyText = txt
+        return self._cachedWave
+
     def resoTextChanged(self, text):
-        try:
-            dist_s = "%.2f" % (
-                daq_utils.distance_from_reso(
-                    daq_utils.det_radius,
-                    float(text),
-                    daq_utils.energy2wave(float(self.energy_ledit.text())),
-                    0,
-                )
-            )
-        except ValueError:
+        wave = self.currentWave()
+        if (
+            wave is not None
+            and self.plainDoubleValidator.validate(text, 0)[0]
+            == QtGui.QValidator.Acceptable
+        ):
+            reso, ok = self.plainDoubleValidator.locale().toDouble(text)
+        else:
+            ok = False
+        if ok:
+            dist_s = "%.2f" % distanceFromResoCached(reso, wave)
+        else:
             dist_s = self.detDistRBVLabel.getEntry().text()
         self.detDistMotorEntry.getEntry().setText(dist_s)
 
     def detDistTextChanged(self, text):
-        try:
-            reso_s = "%.2f" % (
-                daq_utils.calc_reso(
-                    daq_utils.det_radius,
-                    float(text),
-                    daq_utils.energy2wave(float(self.energy_ledit.text())),
-                    0,
-                )
-            )
-        except ValueError:
-            reso_s = "50.0"
-        except TypeError:
+        wave = self.currentWave()
+        if (
+            wave is not None
+            and self.plainDoubleValidator.validate(text, 0)[0]
+            == QtGui.QValidator.Acceptable
+        ):
+            dist, ok = self.plainDoubleValidator.locale().toDouble(text)
+        else:
+            ok = False
+        if ok:
+            reso_s = "%.2f" % calcResoCached(dist, wave)
+        else:
             reso_s = "50.0"
         self.setGuiValues({"resolution": reso_s})
 
@@ -2423,13 +2534,12 @@ class ControlMain(QtWidgets.QMainWindow):
         sender = self.sender()
         validator = sender.validator()
         state = validator.validate(sender.text(), 0)[0]
-        if state == QtGui.QValidator.Intermediate:
-            color = "#fff79a"  # yellow
-        elif state == QtGui.QValidator.Invalid:
-            color = "#f6989d"  # red
-        else:
-            color = "#ffffff"  # white
-        sender.setStyleSheet("QLineEdit { background-color: %s }" % color)
+        # setStyleSheet forces a style repolish, so reuse the precompiled
+        # sheet for the state and skip the set when it hasn't changed
+        styleSheet = ENTRY_STATE_STYLES.get(state, ENTRY_STATE_STYLE_OK)
+        if sender.property("entryStateStyle") != styleSheet:
+            sender.setProperty("entryStateStyle", styleSheet)
+            sender.setStyleSheet(styleSheet)
 
     def validateAllFields(self):
         fields_dict = {
@@ -2479,17 +2589,9 @@ class ControlMain(QtWidgets.QMainWindow):
         return True
 
     def protoRadioToggledCB(self, text):
-        if self.protoStandardRadio.isChecked():
-            self.protoComboBox.setCurrentIndex(self.protoComboBox.findText("standard"))
-            self.protoComboActivatedCB(text)
-        elif self.protoRasterRadio.isChecked():
-            self.protoComboBox.setCurrentIndex(self.protoComboBox.findText("raster"))
-            self.protoComboActivatedCB(text)
-        elif self.protoVectorRadio.isChecked():
-            self.protoComboBox.setCurrentIndex(self.protoComboBox.findText("vector"))
+        if text in self.protoComboBoxIndex:
+            self.protoComboBox.setCurrentIndex(self.protoComboBoxIndex[text])
             self.protoComboActivatedCB(text)
-        else:
-            pass
 
     def beamsizeComboActivatedCB(self, text):
         self.send_to_server("set_beamsize", BEAMSIZE_OPTIONS[text])
@@ -2497,7 +2599,7 @@ class ControlMain(QtWidgets.QMainWindow):
 
     def protoComboActivatedCB(self, text):
         self.showProtParams()
-        protocol = str(self.protoComboBox.currentText())
+        protocol = self.currentProtocol
         if protocol in ("raster", "stepRaster", "rasterScreen", "multiCol"):
             self.vidActionRasterDefRadio.setChecked(True)
         else:
@@ -2539,7 +2641,7 @@ class ControlMain(QtWidgets.QMainWindow):
             )
             self.osc_start_ledit.setEnabled(True)
             self.osc_end_ledit.setEnabled(True)
-            if daq_utils.beamline == "fmx":
+            if _IS_FMX:
                 self.calcLifetimeCB()
         elif protocol == "burn":
             self.setGuiValues(
@@ -2565,7 +2667,7 @@ class ControlMain(QtWidgets.QMainWindow):
             self.osc_start_ledit.setEnabled(True)
             self.osc_end_ledit.setEnabled(True)
             self.protoVectorRadio.setChecked(True)
-            if daq_utils.beamline == "fmx":
+            if _IS_FMX:
                 self.calcLifetimeCB()
         else:
             self.protoOtherRadio.setChecked(True)
@@ -2716,10 +2818,18 @@ class ControlMain(QtWidgets.QMainWindow):
         if hasattr(self, "sampleLifetimeReadback_ledit"):
             self.sampleLifetimeReadback_ledit.setStyleSheet("color : gray")
 
+    def ensureRaddoseWorkdir(self):
+        """Stage raddose-3d's input pdb and scratch dir in the visit dir."""
+        # a broken raddose input only costs the lifetime estimate; it must
+        # not keep the GUI from starting
+        try:
+            if not os.path.exists("2vb1.pdb"):
+                shutil.copy2(os.path.join(os.environ["CONFIGDIR"], "2vb1.pdb"), ".")
+            os.makedirs("rd3d", exist_ok=True)
+        except (OSError, KeyError) as e:
+            logger.error("could not stage raddose workdir: %s" % e)
+
     def spawnRaddoseThread(self):
-        if not os.path.exists("2vb1.pdb"):
-            os.system("cp -a $CONFIGDIR/2vb1.pdb .")
-            os.system("mkdir rd3d")
         energyReadback = self.energy_pv.get() / 1000.0
         sampleFlux = self.sampleFluxPV.get()
         if hasattr(self, "transmission_ledit") and hasattr(
@@ -2731,7 +2841,7 @@ class ControlMain(QtWidgets.QMainWindow):
                 ) / float(self.transmissionReadback_ledit.text())
             except Exception as e:
                 logger.info(f"Exception while calculating sample flux {e}")
-        logger.info("sample flux = " + str(sampleFlux))
+        logger.info(f"sample flux = {sampleFlux}")
         # Read vector length only if the vector protocol is chosen
         vecLen = 0
         if self.protoVectorRadio.isChecked():
@@ -2740,38 +2850,30 @@ class ControlMain(QtWidgets.QMainWindow):
             except:
                 pass
 
-        try:
-            wedge = float(self.osc_end_ledit.text())
-            raddose_thread = RaddoseThread(
-                parent=self,
-                beamsizeV=3.0,
-                beamsizeH=5.0,
-                vectorL=vecLen,
-                energy=energyReadback,
-                wedge=wedge,
-                flux=sampleFlux,
-                verbose=True,
-            )
-            raddose_thread.lifetime.connect(
-                lambda lifetime: self.setLifetimeCB(lifetime)
-            )
-            raddose_thread.start()
-
-        except:
-            lifeTime_s = "0.00"
+        wedge = self.parseFloat(self.osc_end_ledit, default=None)
+        if wedge is None:
+            return
+        self.raddoseRequestSignal.emit(
+            {
+                "beamsizeV": 3.0,
+                "beamsizeH": 5.0,
+                "vectorL": vecLen,
+                "energy": energyReadback,
+                "wedge": wedge,
+                "flux": sampleFlux,
+                "verbose": True,
+            }
+        )
 
     def setTransCB(self):
-        try:
-            if (
-                float(self.transmission_ledit.text()) > 1.0
-                or float(self.transmission_ledit.text()) < 0.001
-            ):
-                self.popupServerMessage("Transmission must be 0.001-1.0")
-                return
-        except ValueError as e:
+        transmission = self.parseFloat(self.transmission_ledit, default=None)
+        if transmission is None:
             self.popupServerMessage("Please enter a valid number")
             return
-        self.send_to_server("setTrans", [float(self.transmission_ledit.text())])
+        if transmission > 1.0 or transmission < 0.001:
+            self.popupServerMessage("Transmission must be 0.001-1.0")
+            return
+        self.send_to_server("setTrans", [transmission])
 
     def setDCStartCB(self):
         currentPos = float(self.sampleOmegaRBVLedit.getEntry().text()) % 360.0
@@ -2927,7 +3029,7 @@ class ControlMain(QtWidgets.QMainWindow):
         length = self.measureLine.line().length()
         fov = self.getCurrentFOV()
         lineMicronsX = int(round(length * (fov["x"] / daq_utils.screenPixX)))
-        logger.info("linelength = " + str(lineMicronsX))
+        logger.info(f"linelength = {lineMicronsX}")
         self.click_positions = []
 
     def center3LoopCB(self):
@@ -2939,7 +3041,7 @@ class ControlMain(QtWidgets.QMainWindow):
     def fillPolyRaster(
         self, rasterReq
     ):  # at this point I should have a drawn polyRaster
-        logger.info("filling poly for " + str(rasterReq["uid"]))
+        logger.info(f"filling poly for {rasterReq['uid']}")
         rasterResults = db_lib.getResultsforRequest(rasterReq["uid"])
         
         if not rasterResults:
@@ -2996,7 +3098,7 @@ class ControlMain(QtWidgets.QMainWindow):
                     cellResult = cellResults[spotLineCounter]
                 except IndexError:
                     logger.error("caught index error #1")
-                    logger.error("numlines = " + str(numLines))
+                    logger.error(f"numlines = {numLines}")
                     logger.error(
                         "expected: " + str(len(rasterDef["rowDefs"]) * numsteps)
                     )
@@ -3020,7 +3122,7 @@ class ControlMain(QtWidgets.QMainWindow):
 
                 except IndexError:
                     logger.error("caught index error #2")
-                    logger.error("numlines = " + str(numLines))
+                    logger.error(f"numlines = {numLines}")
                     logger.error(
                         "expected: " + str(len(rasterDef["rowDefs"]) * numsteps)
                     )
@@ -3084,8 +3186,7 @@ class ControlMain(QtWidgets.QMainWindow):
             + directory[directory.find(visitName) + len(visitName) : len(directory)]
         )
         fullJpegDirectory = basePath + "/" + jpegDirectory
-        if not os.path.exists(fullJpegDirectory):
-            os.system("mkdir -p " + fullJpegDirectory)
+        os.makedirs(fullJpegDirectory, exist_ok=True)
         jpegImagePrefix = fullJpegDirectory + "/" + filePrefix
         jpegImageFilename = jpegImagePrefix + ".jpg"
         jpegImageThumbFilename = jpegImagePrefix + "t.jpg"
@@ -3445,50 +3546,30 @@ class ControlMain(QtWidgets.QMainWindow):
                 rasterDir = "vertical"
         except IndexError:
             return
-        for i in range(len(rasterDef["rowDefs"])):
-            rowCellCount = 0
-            for j in range(rasterDef["rowDefs"][i]["numsteps"]):
-                if rasterDir == "horizontal":
-                    newCellX = (
-                        self.screenXmicrons2pixels(
-                            rasterDef["rowDefs"][i]["start"]["x"]
-                        )
-                        + (j * stepsizeX)
-                        + self.centerMarker.x()
-                        + self.centerMarkerCharOffsetX
-                    )
-                    newCellY = (
-                        self.screenYmicrons2pixels(
-                            rasterDef["rowDefs"][i]["start"]["y"]
-                        )
-                        + self.centerMarker.y()
-                        + self.centerMarkerCharOffsetY
-                    )
-                else:
-                    newCellX = (
-                        self.screenXmicrons2pixels(
-                            rasterDef["rowDefs"][i]["start"]["x"]
-                        )
-                        + self.centerMarker.x()
-                        + self.centerMarkerCharOffsetX
-                    )
-                    newCellY = (
-                        self.screenYmicrons2pixels(
-                            rasterDef["rowDefs"][i]["start"]["y"]
-                        )
-                        + (j * stepsizeY)
-                        + self.centerMarker.y()
-                        + self.centerMarkerCharOffsetY
-                    )
-                if rowCellCount == 0:  # start of a new row
-                    rowStartX = newCellX
-                    rowStartY = newCellY
-                newCellX = int(newCellX)
-                newCellY = int(newCellY)
+        # everything but the step offset is constant across the cells of a
+        # row (and the direction across the whole raster), so hoist those
+        # out of the per-cell loop
+        horizontal = rasterDir == "horizontal"
+        screenXmicrons2pixels = self.screenXmicrons2pixels
+        screenYmicrons2pixels = self.screenYmicrons2pixels
+        offsetX = self.centerMarker.x() + self.centerMarkerCharOffsetX
+        offsetY = self.centerMarker.y() + self.centerMarkerCharOffsetY
+        for rowDef in rasterDef["rowDefs"]:
+            numsteps = rowDef["numsteps"]
+            rowStartX = screenXmicrons2pixels(rowDef["start"]["x"]) + offsetX
+            rowStartY = screenYmicrons2pixels(rowDef["start"]["y"]) + offsetY
+            # batch the per-cell coordinate arithmetic through NumPy so
+            # Python is only entered to construct the Qt items
+            if horizontal:
+                cellXs = (rowStartX + np.arange(numsteps) * stepsizeX).astype(int)
+                cellYs = np.full(numsteps, int(rowStartY))
+            else:
+                cellXs = np.full(numsteps, int(rowStartX))
+                cellYs = (rowStartY + np.arange(numsteps) * stepsizeY).astype(int)
+            for newCellX, newCellY in zip(cellXs.tolist(), cellYs.tolist()):
                 newCell = RasterCell(newCellX, newCellY, stepsizeX, stepsizeY, self)
                 newRasterCellList.append(newCell)
                 newCell.setPen(pen)
-                rowCellCount = rowCellCount + 1  # really just for test of new row
         newItemGroup = RasterGroup(self)
         self.scene.addItem(newItemGroup)
         for i in range(len(newRasterCellList)):
@@ -3690,7 +3771,7 @@ class ControlMain(QtWidgets.QMainWindow):
         reqObj["fastEP"] = self.fastEPCheckBox.isChecked()
         reqObj["dimple"] = self.dimpleCheckBox.isChecked()
         reqObj["xia2"] = self.xia2CheckBox.isChecked()
-        reqObj["protocol"] = str(self.protoComboBox.currentText())
+        reqObj["protocol"] = self.currentProtocol
         if reqObj["protocol"] == "vector" or reqObj["protocol"] == "stepVector":
             reqObj["vectorParams"]["fpp"] = int(self.vectorFPP_ledit.text())
         colRequest["request_obj"] = reqObj
@@ -3699,8 +3780,8 @@ class ControlMain(QtWidgets.QMainWindow):
 
     def addRequestsToAllSelectedCB(self):
         if (
-            self.protoComboBox.currentText() == "raster"
-            or self.protoComboBox.currentText() == "stepRaster"
+            self.currentProtocol == "raster"
+            or self.currentProtocol == "stepRaster"
         ):  # it confused people when they didn't need to add rasters explicitly
             return
         selmod = self.dewarTree.selectionModel()
@@ -3801,7 +3882,7 @@ class ControlMain(QtWidgets.QMainWindow):
         try:
             if (
                 float(self.osc_end_ledit.text()) < float(self.osc_range_ledit.text())
-            ) and str(self.protoComboBox.currentText()) != "eScan":
+            ) and self.currentProtocol != "eScan":
                 self.popupServerMessage("Osc range less than Osc width")
                 return
         except ValueError:
@@ -3816,7 +3897,7 @@ class ControlMain(QtWidgets.QMainWindow):
             if self.periodicTable.eltCurrent != None:
                 symbol = self.periodicTable.eltCurrent.symbol
                 targetEdge = element_info[symbol][2]
-                if daq_utils.beamline == "fmx":
+                if _IS_FMX:
                     mcaRoiLo = element_info[symbol][4]
                     mcaRoiHi = element_info[symbol][5]
                 else:
@@ -3956,7 +4037,7 @@ class ControlMain(QtWidgets.QMainWindow):
                         self.popupServerMessage(f"{message}")
                         return
                     reqObj["detDist"] = float(self.detDistMotorEntry.getEntry().text())
-                    reqObj["protocol"] = str(self.protoComboBox.currentText())
+                    reqObj["protocol"] = self.currentProtocol
                     reqObj["pos_x"] = float(
                         self.centeringMarksList[i]["sampCoords"]["x"]
                     )
@@ -3978,6 +4059,7 @@ class ControlMain(QtWidgets.QMainWindow):
                         reqObj["protocol"] == "characterize"
                         or reqObj["protocol"] == "ednaCol"
                     ):
+                        self.ensureCharacterizeParamsFrame()
                         characterizationParams = {
                             "aimed_completeness": float(
                                 self.characterizeCompletenessEdit.text()
@@ -4096,7 +4178,7 @@ class ControlMain(QtWidgets.QMainWindow):
                 wave = 1.1
 
             reqObj["wavelength"] = wave
-            reqObj["protocol"] = str(self.protoComboBox.currentText())
+            reqObj["protocol"] = self.currentProtocol
             try:
                 reqObj["detDist"] = float(self.detDistMotorEntry.getEntry().text())
             except ValueError:
@@ -4104,6 +4186,7 @@ class ControlMain(QtWidgets.QMainWindow):
                 logger.error("set dist to %s in exception handler 1" % new_distance)
                 reqObj["detDist"] = new_distance
             if reqObj["protocol"] == "multiCol" or reqObj["protocol"] == "multiColQ":
+                self.ensureMultiColParamsFrame()
                 reqObj["gridStep"] = float(self.rasterStepEdit.text())
                 reqObj["diffCutoff"] = float(self.multiColCutoffEdit.text())
             if reqObj["protocol"] == "rasterScreen":
@@ -4112,6 +4195,7 @@ class ControlMain(QtWidgets.QMainWindow):
                 reqObj["rasterDef"] = rasterDef
                 reqObj["gridStep"] = float(self.rasterStepEdit.text())
             if reqObj["protocol"] == "characterize" or reqObj["protocol"] == "ednaCol":
+                self.ensureCharacterizeParamsFrame()
                 characterizationParams = {
                     "aimed_completeness": float(
                         self.characterizeCompletenessEdit.text()
@@ -4214,8 +4298,8 @@ class ControlMain(QtWidgets.QMainWindow):
             )
             self.timerSample.start(SAMPLE_TIMER_DELAY)
             if reply == QtWidgets.QMessageBox.Yes:
-                if daq_utils.beamline == "fmx" or daq_utils.beamline == "amx":
-                    restart_pv = PV(daq_utils.beamlineComm + "RestartServerSignal")
+                if _IS_FMX or _IS_AMX:
+                    restart_pv = getPv(daq_utils.beamlineComm + "RestartServerSignal")
                     restart_pv.put(not (restart_pv.get()))
                 else:
                     logger.error("Not restarting server - unknown beamline")
@@ -4338,7 +4422,7 @@ class ControlMain(QtWidgets.QMainWindow):
         
         self.zoom2Radio.setChecked(True)
         self.zoomLevelToggledCB("Zoom2")
-        self.protoComboBox.setCurrentIndex(self.protoComboBox.findText(str("standard")))
+        self.protoComboBox.setCurrentIndex(self.protoComboBoxIndex["standard"])
         self.protoComboActivatedCB("standard")
 
     def unmountSampleCB(self):
@@ -4353,7 +4437,7 @@ class ControlMain(QtWidgets.QMainWindow):
     def fillRequestParameters(self, reqObj):
         """Fills UI elements based on reqObj dictionary passed to it"""
         self.protoComboBox.setCurrentIndex(
-            self.protoComboBox.findText(str(reqObj["protocol"]))
+            self.protoComboBoxIndex.get(str(reqObj["protocol"]), -1)
         )
         protocol = str(reqObj["protocol"])
         if protocol == "raster":
@@ -4490,6 +4574,7 @@ class ControlMain(QtWidgets.QMainWindow):
             or str(reqObj["protocol"]) == "ednaCol"
         ):
             characterizationParams = reqObj["characterizationParams"]
+            self.ensureCharacterizeParamsFrame()
             self.characterizeCompletenessEdit.setText(
                 str(characterizationParams["aimed_completeness"])
             )
@@ -4536,7 +4621,7 @@ class ControlMain(QtWidgets.QMainWindow):
             sample = db_lib.getSampleByID(self.selectedSampleID)
             owner = sample["owner"]
             sample_name = db_lib.getSampleNamebyID(self.selectedSampleID)
-            logger.info("sample in pos " + str(itemData))
+            logger.info(f"sample in pos {itemData}")
             if (
                 sample["uid"] != self.mountedPin_pv.get()
                 and getBlConfig("queueCollect") == 0
@@ -4561,7 +4646,7 @@ class ControlMain(QtWidgets.QMainWindow):
                 )
                 if self.vidActionRasterDefRadio.isChecked():
                     self.protoComboBox.setCurrentIndex(
-                        self.protoComboBox.findText(str("raster"))
+                        self.protoComboBoxIndex["raster"]
                     )
                     self.showProtParams()
             else:
@@ -4628,8 +4713,20 @@ class ControlMain(QtWidgets.QMainWindow):
         self.mountedPinSignal.emit(mountedPinPos)
 
     def beamSizeChangedCB(self, value=None, char_value=None, **kw):
-        beamSizeFlag = value
-        self.beamSizeSignal.emit(beamSizeFlag)
+        # runs in the CA thread - stash the value and poke the coalescing
+        # timer so the GUI sees at most one update per interval
+        self._beamSizePending = value
+        self.beamSizeTimerStartSignal.emit()
+
+    def startBeamSizeTimer(self):
+        # start() restarts an active timer, so under a chatty PV that
+        # would postpone the flush forever; only arm it when idle to get
+        # at most one update per interval
+        if not self._beamSizeTimer.isActive():
+            self._beamSizeTimer.start(PV_UPDATE_COALESCE_MS)
+
+    def flushBeamSizeCB(self):
+        self.beamSizeSignal.emit(self._beamSizePending)
 
     def controlMasterChangedCB(self, value=None, char_value=None, **kw):
         controlMasterPID = value
@@ -4668,8 +4765,16 @@ class ControlMain(QtWidgets.QMainWindow):
         self.zebraPulseStateSignal.emit(state)
 
     def stillModeStateChangedCB(self, value=None, char_value=None, **kw):
-        state = value
-        self.stillModeStateSignal.emit(state)
+        # runs in the CA thread - coalesced the same way as beamSizeChangedCB
+        self._stillModeStatePending = value
+        self.stillModeTimerStartSignal.emit()
+
+    def startStillModeStateTimer(self):
+        if not self._stillModeStateTimer.isActive():
+            self._stillModeStateTimer.start(PV_UPDATE_COALESCE_MS)
+
+    def flushStillModeStateCB(self):
+        self.stillModeStateSignal.emit(self._stillModeStatePending)
 
     def zebraDownloadStateChangedCB(self, value=None, char_value=None, **kw):
         state = value
@@ -4749,9 +4854,9 @@ class ControlMain(QtWidgets.QMainWindow):
 
     def initUI(self):
         self.tabs = QtWidgets.QTabWidget()
-        self.comm_pv = PV(daq_utils.beamlineComm + "command_s")
-        self.immediate_comm_pv = PV(daq_utils.beamlineComm + "immediate_command_s")
-        self.stillModeStatePV = PV(daq_utils.pvLookupDict["stillModeStatus"])
+        self.comm_pv = getPv(daq_utils.beamlineComm + "command_s")
+        self.immediate_comm_pv = getPv(daq_utils.beamlineComm + "immediate_command_s")
+        self.stillModeStatePV = getPv(daq_utils.pvLookupDict["stillModeStatus"])
         self.progressDialog = QtWidgets.QProgressDialog()
         self.progressDialog.setCancelButtonText("Cancel")
         self.progressDialog.setModal(False)
@@ -4867,161 +4972,249 @@ class ControlMain(QtWidgets.QMainWindow):
         self.hutchTopCamThread.stop()
         self.hutchCornerCamThread.wait()
         self.hutchTopCamThread.wait()
+        self.raddoseWorkerThread.quit()
+        self.raddoseWorkerThread.wait()
         QtWidgets.QApplication.instance().quit()
 
+    def initPVs(self):
+        # Create every PV with connection_timeout=0 so all of the CA
+        # searches go out back-to-back, then drive the connections with a
+        # single poll - roughly one network round-trip instead of one per PV.
+        pvNames = {
+            "treeChanged_pv": daq_utils.beamlineComm + "live_q_change_flag",
+            "mountedPin_pv": daq_utils.beamlineComm + "mounted_pin",
+            "stopDet_pv": daq_utils.pvLookupDict["stopEiger"],
+            "rebootDetIOC_pv": daq_utils.pvLookupDict["eigerIOC_reboot"],
+            "resetZebra_pv": daq_utils.pvLookupDict["zebraReset"],
+            "rebootZebraIOC_pv": daq_utils.pvLookupDict["zebraRebootIOC"],
+            "zebraArmedPV": daq_utils.pvLookupDict["zebraArmStatus"],
+            "govRobotSeReachPV": daq_utils.pvLookupDict["govRobotSeReach"],
+            "govRobotSaReachPV": daq_utils.pvLookupDict["govRobotSaReach"],
+            "govRobotDaReachPV": daq_utils.pvLookupDict["govRobotDaReach"],
+            "govRobotBlReachPV": daq_utils.pvLookupDict["govRobotBlReach"],
+            "detectorMessagePV": daq_utils.pvLookupDict["eigerStatMessage"],
+            "zebraPulsePV": daq_utils.pvLookupDict["zebraPulseStatus"],
+            "zebraDownloadPV": daq_utils.pvLookupDict["zebraDownloading"],
+            "zebraSentTriggerPV": daq_utils.pvLookupDict["zebraSentTriggerStatus"],
+            "zebraReturnedTriggerPV": daq_utils.pvLookupDict[
+                "zebraTriggerReturnStatus"
+            ],
+            "controlMaster_pv": daq_utils.beamlineComm + "zinger_flag",
+            "beamCenterX_pv": daq_utils.pvLookupDict["beamCenterX"],
+            "beamCenterY_pv": daq_utils.pvLookupDict["beamCenterY"],
+            "choochResultFlag_pv": daq_utils.beamlineComm + "choochResultFlag",
+            "xrecRasterFlag_pv": daq_utils.beamlineComm + "xrecRasterFlag",
+            "message_string_pv": daq_utils.beamlineComm + "message_string",
+            "popup_message_string_pv": daq_utils.beamlineComm
+            + "gui_popup_message_string",
+            "program_state_pv": daq_utils.beamlineComm + "program_state",
+            "pause_button_state_pv": daq_utils.beamlineComm + "pause_button_state",
+            "sampx_pv": daq_utils.motor_dict["sampleX"] + ".RBV",
+            "sampy_pv": daq_utils.motor_dict["sampleY"] + ".RBV",
+            "sampz_pv": daq_utils.motor_dict["sampleZ"] + ".RBV",
+            "omega_pv": daq_utils.motor_dict["omega"] + ".VAL",
+            "omegaTweak_pv": daq_utils.motor_dict["omega"] + ".RLV",
+            "omegaRBV_pv": daq_utils.motor_dict["omega"] + ".RBV",
+            "sampyTweak_pv": daq_utils.motor_dict["sampleY"] + ".RLV",
+            "photonShutterOpen_pv": daq_utils.pvLookupDict["photonShutterOpen"],
+            "photonShutterClose_pv": daq_utils.pvLookupDict["photonShutterClose"],
+            "fastShutterRBV_pv": daq_utils.motor_dict["fastShutter"] + ".RBV",
+        }
+        if self.scannerType == "PI":
+            pvNames["sampFineX_pv"] = daq_utils.motor_dict["fineX"] + ".RBV"
+            pvNames["sampFineY_pv"] = daq_utils.motor_dict["fineY"] + ".RBV"
+            pvNames["sampFineZ_pv"] = daq_utils.motor_dict["fineZ"] + ".RBV"
+        if _IS_NYX:
+            pvNames["sampzTweak_pv"] = daq_utils.motor_dict["sampleX"] + ".RLV"
+        else:
+            pvNames["sampzTweak_pv"] = daq_utils.motor_dict["sampleZ"] + ".RLV"
+        for attr, pvName in pvNames.items():
+            logger.info("creating %s: %s" % (attr, pvName))
+            setattr(self, attr, getPv(pvName, connection_timeout=0))
+        epics.ca.pend_event(0.1)
+        # connection_timeout sticks to the PV for its whole life, and at 0 a
+        # later get() on a slow or reconnecting PV returns None immediately.
+        # Now that the searches are all in flight, put back the pyepics
+        # default so gets block briefly instead of handing None downstream
+        for attr in pvNames:
+            getattr(self, attr).connection_timeout = None
+
     def initCallbacks(self):
-        self.beamSizeSignal.connect(self.processBeamSize)
+        self.initPVs()
+
+        self._beamSizePending = None
+        self._beamSizeTimer = QTimer(self)
+        self._beamSizeTimer.setSingleShot(True)
+        self._beamSizeTimer.timeout.connect(self.flushBeamSizeCB)
+        self.beamSizeTimerStartSignal.connect(
+            self.startBeamSizeTimer, QtCore.Qt.QueuedConnection
+        )
+        self.beamSizeSignal.connect(
+            self.processBeamSize, QtCore.Qt.QueuedConnection
+        )
         self.beamSize_pv.add_callback(self.beamSizeChangedCB)
 
-        self.treeChanged_pv = PV(daq_utils.beamlineComm + "live_q_change_flag")
-        self.refreshTreeSignal.connect(self.dewarTree.refreshTree)
+        self.refreshTreeSignal.connect(
+            self.dewarTree.refreshTree, QtCore.Qt.QueuedConnection
+        )
         self.treeChanged_pv.add_callback(self.treeChangedCB)
-        self.mountedPin_pv = PV(daq_utils.beamlineComm + "mounted_pin")
-        self.mountedPinSignal.connect(self.processMountedPin)
+        self.mountedPinSignal.connect(
+            self.processMountedPin, QtCore.Qt.QueuedConnection
+        )
         self.mountedPin_pv.add_callback(self.mountedPinChangedCB)
-        det_stop_pv = daq_utils.pvLookupDict["stopEiger"]
-        logger.info("setting stop Eiger detector PV: %s" % det_stop_pv)
-        self.stopDet_pv = PV(det_stop_pv)
-        det_reboot_pv = daq_utils.pvLookupDict["eigerIOC_reboot"]
-        logger.info("setting detector ioc reboot PV: %s" % det_reboot_pv)
-        self.rebootDetIOC_pv = PV(det_reboot_pv)
-        rz_pv = daq_utils.pvLookupDict["zebraReset"]
-        logger.info("setting zebra reset PV: %s" % rz_pv)
-        self.resetZebra_pv = PV(rz_pv)
-        rz_reboot_pv = daq_utils.pvLookupDict["zebraRebootIOC"]
-        logger.info("setting zebra reboot ioc PV: %s" % rz_reboot_pv)
-        self.rebootZebraIOC_pv = PV(rz_reboot_pv)
-        self.zebraArmedPV = PV(daq_utils.pvLookupDict["zebraArmStatus"])
-        self.zebraArmStateSignal.connect(self.processZebraArmState)
+        self.zebraArmStateSignal.connect(
+            self.processZebraArmState, QtCore.Qt.QueuedConnection
+        )
         self.zebraArmedPV.add_callback(self.zebraArmStateChangedCB)
 
-        self.govRobotSeReachPV = PV(daq_utils.pvLookupDict["govRobotSeReach"])
-        self.govRobotSeReachSignal.connect(self.processGovRobotSeReach)
+        self.govRobotSeReachSignal.connect(
+            self.processGovRobotSeReach, QtCore.Qt.QueuedConnection
+        )
         self.govRobotSeReachPV.add_callback(self.govRobotSeReachChangedCB)
 
-        self.govRobotSaReachPV = PV(daq_utils.pvLookupDict["govRobotSaReach"])
-        self.govRobotSaReachSignal.connect(self.processGovRobotSaReach)
+        self.govRobotSaReachSignal.connect(
+            self.processGovRobotSaReach, QtCore.Qt.QueuedConnection
+        )
         self.govRobotSaReachPV.add_callback(self.govRobotSaReachChangedCB)
 
-        self.govRobotDaReachPV = PV(daq_utils.pvLookupDict["govRobotDaReach"])
-        self.govRobotDaReachSignal.connect(self.processGovRobotDaReach)
+        self.govRobotDaReachSignal.connect(
+            self.processGovRobotDaReach, QtCore.Qt.QueuedConnection
+        )
         self.govRobotDaReachPV.add_callback(self.govRobotDaReachChangedCB)
 
-        self.govRobotBlReachPV = PV(daq_utils.pvLookupDict["govRobotBlReach"])
-        self.govRobotBlReachSignal.connect(self.processGovRobotBlReach)
+        self.govRobotBlReachSignal.connect(
+            self.processGovRobotBlReach, QtCore.Qt.QueuedConnection
+        )
         self.govRobotBlReachPV.add_callback(self.govRobotBlReachChangedCB)
 
-        self.detectorMessagePV = PV(daq_utils.pvLookupDict["eigerStatMessage"])
-        self.detMessageSignal.connect(self.processDetMessage)
+        self.detMessageSignal.connect(
+            self.processDetMessage, QtCore.Qt.QueuedConnection
+        )
         self.detectorMessagePV.add_callback(self.detMessageChangedCB)
 
-        self.sampleFluxSignal.connect(self.processSampleFlux)
+        self.sampleFluxSignal.connect(
+            self.processSampleFlux, QtCore.Qt.QueuedConnection
+        )
         self.sampleFluxPV.add_callback(self.sampleFluxChangedCB)
 
-        self.stillModeStateSignal.connect(self.processStillModeState)
+        self._stillModeStatePending = None
+        self._stillModeStateTimer = QTimer(self)
+        self._stillModeStateTimer.setSingleShot(True)
+        self._stillModeStateTimer.timeout.connect(self.flushStillModeStateCB)
+        self.stillModeTimerStartSignal.connect(
+            self.startStillModeStateTimer, QtCore.Qt.QueuedConnection
+        )
+        self.stillModeStateSignal.connect(
+            self.processStillModeState, QtCore.Qt.QueuedConnection
+        )
         self.stillModeStatePV.add_callback(self.stillModeStateChangedCB)
 
-        self.zebraPulsePV = PV(daq_utils.pvLookupDict["zebraPulseStatus"])
-        self.zebraPulseStateSignal.connect(self.processZebraPulseState)
+        self.zebraPulseStateSignal.connect(
+            self.processZebraPulseState, QtCore.Qt.QueuedConnection
+        )
         self.zebraPulsePV.add_callback(self.zebraPulseStateChangedCB)
 
-        self.zebraDownloadPV = PV(daq_utils.pvLookupDict["zebraDownloading"])
-        self.zebraDownloadStateSignal.connect(self.processZebraDownloadState)
+        self.zebraDownloadStateSignal.connect(
+            self.processZebraDownloadState, QtCore.Qt.QueuedConnection
+        )
         self.zebraDownloadPV.add_callback(self.zebraDownloadStateChangedCB)
 
-        self.zebraSentTriggerPV = PV(daq_utils.pvLookupDict["zebraSentTriggerStatus"])
-        self.zebraSentTriggerStateSignal.connect(self.processZebraSentTriggerState)
+        self.zebraSentTriggerStateSignal.connect(
+            self.processZebraSentTriggerState, QtCore.Qt.QueuedConnection
+        )
         self.zebraSentTriggerPV.add_callback(self.zebraSentTriggerStateChangedCB)
 
-        self.zebraReturnedTriggerPV = PV(
-            daq_utils.pvLookupDict["zebraTriggerReturnStatus"]
-        )
         self.zebraReturnedTriggerStateSignal.connect(
-            self.processZebraReturnedTriggerState
+            self.processZebraReturnedTriggerState, QtCore.Qt.QueuedConnection
         )
         self.zebraReturnedTriggerPV.add_callback(
             self.zebraReturnedTriggerStateChangedCB
         )
 
-        self.controlMaster_pv = PV(daq_utils.beamlineComm + "zinger_flag")
-        self.controlMasterSignal.connect(self.processControlMaster)
+        self.controlMasterSignal.connect(
+            self.processControlMaster, QtCore.Qt.QueuedConnection
+        )
         self.controlMaster_pv.add_callback(self.controlMasterChangedCB)
 
-        self.beamCenterX_pv = PV(daq_utils.pvLookupDict["beamCenterX"])
-        self.beamCenterY_pv = PV(daq_utils.pvLookupDict["beamCenterY"])
-
-        self.choochResultFlag_pv = PV(daq_utils.beamlineComm + "choochResultFlag")
-        self.choochResultSignal.connect(self.processChoochResult)
+        self.choochResultSignal.connect(
+            self.processChoochResult, QtCore.Qt.QueuedConnection
+        )
         self.choochResultFlag_pv.add_callback(self.processChoochResultsCB)
-        self.xrecRasterFlag_pv = PV(daq_utils.beamlineComm + "xrecRasterFlag")
         self.xrecRasterFlag_pv.put("0")
-        self.xrecRasterSignal.connect(self.displayXrecRaster)
+        self.xrecRasterSignal.connect(
+            self.displayXrecRaster, QtCore.Qt.QueuedConnection
+        )
         self.xrecRasterFlag_pv.add_callback(self.processXrecRasterCB)
-        self.message_string_pv = PV(daq_utils.beamlineComm + "message_string")
-        self.serverMessageSignal.connect(self.printServerMessage)
+        self.serverMessageSignal.connect(
+            self.printServerMessage, QtCore.Qt.QueuedConnection
+        )
         self.message_string_pv.add_callback(self.serverMessageCB)
-        self.popup_message_string_pv = PV(
-            daq_utils.beamlineComm + "gui_popup_message_string"
+        self.serverPopupMessageSignal.connect(
+            self.popupServerMessage, QtCore.Qt.QueuedConnection
         )
-        self.serverPopupMessageSignal.connect(self.popupServerMessage)
         self.popup_message_string_pv.add_callback(self.serverPopupMessageCB)
-        self.program_state_pv = PV(daq_utils.beamlineComm + "program_state")
-        self.programStateSignal.connect(self.colorProgramState)
+        self.programStateSignal.connect(
+            self.colorProgramState, QtCore.Qt.QueuedConnection
+        )
         self.program_state_pv.add_callback(self.programStateCB)
-        self.pause_button_state_pv = PV(daq_utils.beamlineComm + "pause_button_state")
-        self.pauseButtonStateSignal.connect(self.changePauseButtonState)
+        self.pauseButtonStateSignal.connect(
+            self.changePauseButtonState, QtCore.Qt.QueuedConnection
+        )
         self.pause_button_state_pv.add_callback(self.pauseButtonStateCB)
 
-        self.energyChangeSignal.connect(self.processEnergyChange)
+        self.energyChangeSignal.connect(
+            self.processEnergyChange, QtCore.Qt.QueuedConnection
+        )
         self.energy_pv.add_callback(self.processEnergyChangeCB, motID="x")
 
-        self.sampx_pv = PV(daq_utils.motor_dict["sampleX"] + ".RBV")
-        self.sampMoveSignal.connect(self.processSampMove)
+        self.sampMoveSignal.connect(
+            self.processSampMove, QtCore.Qt.QueuedConnection
+        )
         self.sampx_pv.add_callback(self.processSampMoveCB, motID="x")
-        self.sampy_pv = PV(daq_utils.motor_dict["sampleY"] + ".RBV")
         self.sampy_pv.add_callback(self.processSampMoveCB, motID="y")
-        self.sampz_pv = PV(daq_utils.motor_dict["sampleZ"] + ".RBV")
         self.sampz_pv.add_callback(self.processSampMoveCB, motID="z")
 
         if self.scannerType == "PI":
-            self.sampFineX_pv = PV(daq_utils.motor_dict["fineX"] + ".RBV")
             self.sampFineX_pv.add_callback(self.processSampMoveCB, motID="fineX")
-            self.sampFineY_pv = PV(daq_utils.motor_dict["fineY"] + ".RBV")
             self.sampFineY_pv.add_callback(self.processSampMoveCB, motID="fineY")
-            self.sampFineZ_pv = PV(daq_utils.motor_dict["fineZ"] + ".RBV")
             self.sampFineZ_pv.add_callback(self.processSampMoveCB, motID="fineZ")
 
-        self.omega_pv = PV(daq_utils.motor_dict["omega"] + ".VAL")
-        self.omegaTweak_pv = PV(daq_utils.motor_dict["omega"] + ".RLV")
-        self.sampyTweak_pv = PV(daq_utils.motor_dict["sampleY"] + ".RLV")
-        if daq_utils.beamline == "nyx":
-            self.sampzTweak_pv = PV(daq_utils.motor_dict["sampleX"] + ".RLV")
-        else:
-            self.sampzTweak_pv = PV(daq_utils.motor_dict["sampleZ"] + ".RLV")
-        self.omegaRBV_pv = PV(daq_utils.motor_dict["omega"] + ".RBV")
         self.omegaRBV_pv.add_callback(
             self.processSampMoveCB, motID="omega"
         )  # I think monitoring this allows for the textfield to monitor val and this to deal with the graphics. Else next line has two callbacks on same thing.
-        self.photonShutterOpen_pv = PV(daq_utils.pvLookupDict["photonShutterOpen"])
-        self.photonShutterClose_pv = PV(daq_utils.pvLookupDict["photonShutterClose"])
-        self.fastShutterRBV_pv = PV(daq_utils.motor_dict["fastShutter"] + ".RBV")
-        self.fastShutterSignal.connect(self.processFastShutter)
+        self.fastShutterSignal.connect(
+            self.processFastShutter, QtCore.Qt.QueuedConnection
+        )
         self.fastShutterRBV_pv.add_callback(self.shutterChangedCB)
-        self.gripTempSignal.connect(self.processGripTemp)
+        self.gripTempSignal.connect(
+            self.processGripTemp, QtCore.Qt.QueuedConnection
+        )
         self.gripTemp_pv.add_callback(self.gripTempChangedCB)
         if getBlConfig(CRYOSTREAM_ONLINE):
-            self.cryostreamTempSignal.connect(self.processCryostreamTemp)
+            self.cryostreamTempSignal.connect(
+                self.processCryostreamTemp, QtCore.Qt.QueuedConnection
+            )
             self.cryostreamTemp_pv.add_callback(self.cryostreamTempChangedCB)
-        self.ringCurrentSignal.connect(self.processRingCurrent)
+        self.ringCurrentSignal.connect(
+            self.processRingCurrent, QtCore.Qt.QueuedConnection
+        )
         self.ringCurrent_pv.add_callback(self.ringCurrentChangedCB)
-        self.beamAvailableSignal.connect(self.processBeamAvailable)
+        self.beamAvailableSignal.connect(
+            self.processBeamAvailable, QtCore.Qt.QueuedConnection
+        )
         self.beamAvailable_pv.add_callback(self.beamAvailableChangedCB)
-        self.sampleExposedSignal.connect(self.processSampleExposed)
+        self.sampleExposedSignal.connect(
+            self.processSampleExposed, QtCore.Qt.QueuedConnection
+        )
         self.sampleExposed_pv.add_callback(self.sampleExposedChangedCB)
-        self.highMagCursorChangeSignal.connect(self.processHighMagCursorChange)
+        self.highMagCursorChangeSignal.connect(
+            self.processHighMagCursorChange, QtCore.Qt.QueuedConnection
+        )
         self.highMagCursorX_pv.add_callback(self.processHighMagCursorChangeCB, ID="x")
         self.highMagCursorY_pv.add_callback(self.processHighMagCursorChangeCB, ID="y")
-        self.lowMagCursorChangeSignal.connect(self.processLowMagCursorChange)
+        self.lowMagCursorChangeSignal.connect(
+            self.processLowMagCursorChange, QtCore.Qt.QueuedConnection
+        )
         self.lowMagCursorX_pv.add_callback(self.processLowMagCursorChangeCB, ID="x")
         self.lowMagCursorY_pv.add_callback(self.processLowMagCursorChangeCB, ID="y")
 
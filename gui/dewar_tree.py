@@ -21,6 +21,12 @@ if typing.TYPE_CHECKING:
 
 logger = logging.getLogger()
 
+# Font used to mark the mounted sample - built once, reused per refresh
+MOUNTED_SAMPLE_FONT = QtGui.QFont()
+MOUNTED_SAMPLE_FONT.setUnderline(True)
+MOUNTED_SAMPLE_FONT.setItalic(True)
+MOUNTED_SAMPLE_FONT.setOverline(True)
+
 global sampleDict
 sampleDict = {}
 
@@ -139,11 +145,7 @@ class DewarTree(QtWidgets.QTreeView):
     def set_mounted_sample(self, item):
         # Formats the text of the item that is passed in as the mounted sample
         item.setForeground(QtGui.QColor("red"))
-        font = QtGui.QFont()
-        font.setUnderline(True)
-        font.setItalic(True)
-        font.setOverline(True)
-        item.setFont(font)
+        item.setFont(MOUNTED_SAMPLE_FONT)
 
     def refreshTreeDewarView(self, get_latest_pucks=False):
         puck = ""
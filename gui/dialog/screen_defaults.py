@@ -262,13 +262,12 @@ class ScreenDefaultsDialog(QtWidgets.QDialog):
 
     # code below and its application from: https://snorfalorpagus.net/blog/2014/08/09/validating-user-input-in-pyqt4-using-qvalidator/
     def checkEntryState(self, *args, **kwargs):
+        from gui.control_main import ENTRY_STATE_STYLES, ENTRY_STATE_STYLE_OK
+
         sender = self.sender()
         validator = sender.validator()
         state = validator.validate(sender.text(), 0)[0]
-        if state == QtGui.QValidator.Intermediate:
-            color = "#fff79a"  # yellow
-        elif state == QtGui.QValidator.Invalid:
-            color = "#f6989d"  # red
-        else:
-            color = "#ffffff"  # white
-        sender.setStyleSheet("QLineEdit { background-color: %s }" % color)
+        styleSheet = ENTRY_STATE_STYLES.get(state, ENTRY_STATE_STYLE_OK)
+        if sender.property("entryStateStyle") != styleSheet:
+            sender.setProperty("entryStateStyle", styleSheet)
+            sender.setStyleSheet(styleSheet)
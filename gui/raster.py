@@ -30,42 +30,70 @@ class RasterGroup(QtWidgets.QGraphicsItemGroup):
         self.setAcceptHoverEvents(True)
         self.currentSelectedCell = None
         self.albulaInterface = AlbulaInterface()
+        self._tooltipCacheKey = None
+        self._tooltipCacheHtml = ""
+        # these are created once on ControlMain and never reassigned, so
+        # resolve the attribute chains here instead of per mouse event
+        self._redPen = parent.redPen
+        self._yellowPen = parent.yellowPen
+        self._exploreDialog = parent.rasterExploreDialog
+        self._albulaDispCheckBox = parent.staffScreenDialog.albulaDispCheckBox
+
+    def cellAt(self, pos):
+        """
+        Returns the child cell containing the given group-local position,
+        going through the scene's spatial index instead of a linear scan
+        over childItems()
+        """
+        scene = self.scene()
+        if scene is not None:
+            for item in scene.items(self.mapToScene(pos)):
+                if item.parentItem() is self:
+                    return item
+            return None
+        for cell in self.childItems():
+            if cell.contains(pos):
+                return cell
+        return None
 
     def mousePressEvent(self, e):
-        for i in range(len(self.parent.rasterList)):
-            if self.parent.rasterList[i] != None:
-                if self.parent.rasterList[i]["graphicsItem"].isSelected():
-                    logger.info("found selected raster")
-                    self.parent.SelectedItemData = self.parent.rasterList[i]["uid"]
-                    self.parent.treeChanged_pv.put(1)
+        # in explore mode a click only inspects a cell, so skip the raster
+        # selection scan (and the tree refresh it triggers) entirely
         if self.parent.vidActionRasterExploreRadio.isChecked():
-            for cell in self.childItems():
-                if cell.contains(e.pos()):
-                    if cell.data(0) != None:
-                        if self.currentSelectedCell:
-                            self.currentSelectedCell.setPen(self.parent.redPen)
-                            self.currentSelectedCell.setZValue(0)
-                        spotcount = cell.data(0)
-                        filename = cell.data(1)
-                        d_min = cell.data(2)
-                        intensity = cell.data(3)
-                        if self.parent.staffScreenDialog.albulaDispCheckBox.isChecked():
-                            if filename != "empty":
-                                logger.debug(
-                                    f"filename to display: {filename} spotcount: {spotcount} dmin: {d_min} intensity: {intensity}"
-                                )
-                                self.albulaInterface.open_file(filename)
-                        if not (self.parent.rasterExploreDialog.isVisible()):
-                            self.parent.rasterExploreDialog.show()
-                        self.parent.rasterExploreDialog.setSpotCount(spotcount)
-                        self.parent.rasterExploreDialog.setTotalIntensity(intensity)
-                        self.parent.rasterExploreDialog.setResolution(d_min)
-                        groupList = self.childItems()
-                        cell.setPen(self.parent.yellowPen)
-                        cell.setZValue(1)
-                        self.currentSelectedCell = cell
-                        break
+            cell = self.cellAt(e.pos())
+            if cell is not None and cell.data(0) != None:
+                if self.currentSelectedCell:
+                    self.currentSelectedCell.setPen(self._redPen)
+                    self.currentSelectedCell.setZValue(0)
+                spotcount = cell.data(0)
+                filename = cell.data(1)
+                d_min = cell.data(2)
+                intensity = cell.data(3)
+                if self._albulaDispCheckBox.isChecked():
+                    if filename != "empty":
+                        logger.debug(
+                            "filename to display: %s spotcount: %s dmin: %s intensity: %s",
+                            filename,
+                            spotcount,
+                            d_min,
+                            intensity,
+                        )
+                        self.albulaInterface.open_file(filename)
+                if not (self._exploreDialog.isVisible()):
+                    self._exploreDialog.show()
+                self._exploreDialog.setSpotCount(spotcount)
+                self._exploreDialog.setTotalIntensity(intensity)
+                self._exploreDialog.setResolution(d_min)
+                cell.setPen(self._yellowPen)
+                cell.setZValue(1)
+                self.currentSelectedCell = cell
         else:
+            for raster in self.parent.rasterList:
+                if raster != None:
+                    if raster["graphicsItem"].isSelected():
+                        logger.info("found selected raster")
+                        self.parent.SelectedItemData = raster["uid"]
+                        self.parent.treeChanged_pv.put(1)
             super(RasterGroup, self).mousePressEvent(e)
 
     def mouseMoveEvent(self, e):
@@ -75,7 +103,10 @@ class RasterGroup(QtWidgets.QGraphicsItemGroup):
             pass
 
         super(RasterGroup, self).mouseMoveEvent(e)
-        logger.debug(f"pos:{self.pos()} event:{e}")  # TODO: Add event description
+        # mouse moves fire continuously during drags; skip the Qt pos()
+        # call and the formatting entirely unless debug is on
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("pos:%s event:%s", self.pos(), e)  # TODO: Add event description
 
     def mouseReleaseEvent(self, e):
         super(RasterGroup, self).mouseReleaseEvent(e)
@@ -86,26 +117,27 @@ class RasterGroup(QtWidgets.QGraphicsItemGroup):
 
     def hoverMoveEvent(self, e):
         super(RasterGroup, self).hoverEnterEvent(e)
-        for cell in self.childItems():
-            if cell.contains(e.pos()):
-                if cell.data(0) != None:
-                    spotcount = cell.data(0)
-                    d_min = cell.data(2)
-                    intensity = cell.data(3)
-                    viewPos = self.scene().views()[0].mapFromScene(self.scenePos())
-                    globalPos = self.scene().views()[0].mapToGlobal(viewPos)
-                    text = ""
-                    table_data = {}
-                    
-                    table_data['Spot Count'] = spotcount
-                    table_data['Total Intensity'] = intensity
-                    table_data['Resolution'] = d_min
-                    
-                    text = """<table border='1' style='border-collapse: collapse;'>
-                    """
-                    for key, value in table_data.items():
-                        text += f"""<tr><td style='border: 1px solid black;'>{key}</td>
-                        <td style='border: 1px solid black;'>{value}</td></tr>"""
-                    text = text + "</table>" 
-
-                    QtWidgets.QToolTip.showText(globalPos, text)
+        cell = self.cellAt(e.pos())
+        if cell is not None and cell.data(0) != None:
+            spotcount = cell.data(0)
+            d_min = cell.data(2)
+            intensity = cell.data(3)
+            viewPos = self.scene().views()[0].mapFromScene(self.scenePos())
+            globalPos = self.scene().views()[0].mapToGlobal(viewPos)
+            # hover events arrive at mouse-move frequency, so only
+            # rebuild the HTML when the hovered values change
+            key = (spotcount, intensity, d_min)
+            if key != self._tooltipCacheKey:
+                self._tooltipCacheHtml = (
+                    "<table border='1' style='border-collapse: collapse;'>"
+                    "<tr><td style='border: 1px solid black;'>Spot Count</td>"
+                    f"<td style='border: 1px solid black;'>{spotcount}</td></tr>"
+                    "<tr><td style='border: 1px solid black;'>Total Intensity</td>"
+                    f"<td style='border: 1px solid black;'>{intensity}</td></tr>"
+                    "<tr><td style='border: 1px solid black;'>Resolution</td>"
+                    f"<td style='border: 1px solid black;'>{d_min}</td></tr>"
+                    "</table>"
+                )
+                self._tooltipCacheKey = key
+
+            QtWidgets.QToolTip.showText(globalPos, self._tooltipCacheHtml)
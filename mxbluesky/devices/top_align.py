@@ -1,8 +1,7 @@
 
-from ophyd.areadetector.filestore_mixins import FileStoreTIFF
-from ophyd.areadetector.filestore_mixins import FileStorePluginBase
-from ophyd.areadetector.plugins import TIFFPlugin
-from ophyd.areadetector.plugins import JPEGPlugin, register_plugin, PluginBase
+from ophyd.areadetector.filestore_mixins import FileStoreTIFF, FileStorePluginBase
+from ophyd.areadetector.plugins import (TIFFPlugin, JPEGPlugin, register_plugin,
+                                        PluginBase)
 from ophyd import (Component as Cpt, Signal, EpicsSignal, EpicsSignalRO, Device, 
                     EpicsMotor, ImagePlugin, ROIPlugin, TransformPlugin, 
                     StatsPlugin, ProcessPlugin, SingleTrigger, ProsilicaDetector,
@@ -3,8 +3,7 @@ print(f"Loading {__file__}")
 from enum import IntEnum
 
 from ophyd import (Device, Component as Cpt, FormattedComponent as FC,
-                   Signal)
-from ophyd import (EpicsSignal, EpicsSignalRO, DeviceStatus)
+                   Signal, EpicsSignal, EpicsSignalRO, DeviceStatus)
 from ophyd.utils import set_and_wait
 from bluesky.plans import fly
 import pandas as pd
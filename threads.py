@@ -71,27 +71,24 @@ class VideoThread(QThread):
         self.is_running = False
 
 
-class RaddoseThread(QThread):
+class RaddoseWorker(QObject):
+    """Long-lived raddose-3d worker meant to be moved to a persistent
+    QThread. The parameter set travels with the queued signal that invokes
+    process(), so each request computes exactly the values it was made
+    with and no cross-thread handoff state is needed."""
     lifetime = Signal(float)
-    def __init__(self, *args, avg_dwd = 10, #Default of 10MGy 
-                beamsizeV = 1.0, beamsizeH = 2.0,
-                vectorL = 0.0,
-                energy = 12.66,
-                flux = -1.0,
-                wedge = 180.0,
-                verbose = False, **kwargs):
-        self.avg_dwd = avg_dwd
-        self.beamsizeV = beamsizeV
-        self.beamsizeH = beamsizeH
-        self.vectorL = vectorL
-        self.energy = energy
-        self.flux = flux
-        self.wedge = wedge
-        self.verbose = verbose
-        QThread.__init__(self, *args, **kwargs)
 
-    def run(self):
-        lifetime_value = raddoseLib.fmx_expTime(self.avg_dwd, self.beamsizeV, self.beamsizeH, self.vectorL, self.energy, self.flux, self.wedge, self.verbose)
+    def process(self, params):
+        lifetime_value = raddoseLib.fmx_expTime(
+            params.get("avg_dwd", 10),
+            params.get("beamsizeV", 1.0),
+            params.get("beamsizeH", 2.0),
+            params.get("vectorL", 0.0),
+            params.get("energy", 12.66),
+            params.get("flux", -1.0),
+            params.get("wedge", 180.0),
+            params.get("verbose", False),
+        )
         self.lifetime.emit(lifetime_value)
 
 
@@ -104,8 +101,11 @@ class ServerCheckThread(QThread):
     def run(self):
         import db_lib
         beamline = os.environ["BEAMLINE_ID"]
+        # the GUI's working directory is fixed for the life of the process;
+        # only the server-side config value can change under us
+        working_dir = os.getcwd()
         while True:
-            if db_lib.getBeamlineConfigParam(beamline, "visitDirectory") != os.getcwd():
+            if db_lib.getBeamlineConfigParam(beamline, "visitDirectory") != working_dir:
                 message = "The server visit directory has changed, stopping!"
                 logger.error(message)
                 print(message)
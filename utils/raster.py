@@ -7,19 +7,20 @@ def calculate_matrix_index(k, M, N, pattern="horizontal"):
     index of the result array, shape of the raster and the
     direction of collection
     """
+    # branchless form of the snake reversal: parity selects between rem
+    # and (N - 1 - rem) without a data-dependent branch, and works
+    # elementwise if k arrives as an ndarray
     if pattern == "horizontal":
         i = k // N
-        if i % 2 == 0:  # odd row
-            j = k - (i * N)
-        else:
-            j = N - (k - (i * N)) - 1
+        parity = i & 1
+        rem = k - (i * N)
+        j = rem + parity * (N - 1 - 2 * rem)
         return i, j
     elif pattern == "vertical":
         j = k // M
-        if j % 2 == 0:  # odd column
-            i = k - (j * M)
-        else:
-            i = M - (k - (j * M)) - 1
+        parity = j & 1
+        rem = k - (j * M)
+        i = rem + parity * (M - 1 - 2 * rem)
         return i, j
 
 
@@ -27,37 +28,45 @@ def calculate_flattened_index(i, j, M, N, pattern="horizontal"):
     """
     Returns the index of the result array of a raster based on the
     row and column index, shape of the raster and the
-    direction of collection
+    direction of collection. i and j may be scalars or array-likes;
+    array inputs are evaluated in a single vectorized expression
     """
+    i = np.asarray(i)
+    j = np.asarray(j)
     if pattern == "horizontal":
-        if i % 2 == 0:  # odd row
-            return i * (N) + j
-        else:  # even row
-            return i * N + (N - 1 - j)
+        index = np.where(i % 2 == 0, i * N + j, i * N + (N - 1 - j))
     elif pattern == "vertical":
-        if j % 2 == 0:  # Odd column
-            return j * M + i
-        else:  # Even column
-            return j * M + (M - 1 - i)
+        index = np.where(j % 2 == 0, j * M + i, j * M + (M - 1 - i))
     else:
         raise ValueError("Invalid pattern specified")
+    if index.ndim == 0:  # scalar in, scalar out
+        return index.item()
+    return index
 
 
-def create_snake_array(flattened, raster_type, M, N):
+def create_snake_array(flattened, raster_type, M, N, dtype=np.float64):
     """
     Returns an MxN matrix of raster results given the
-    flattened result array, direction, and shape of the raster
+    flattened result array, direction, and shape of the raster.
+    Array input is reshaped without a copy and snaked in place
     """
-    # Reshape the list to a 2D array
+    # ndarray input reshapes without a copy; anything else is filled in a
+    # single exactly-sized fromiter pass, skipping the type inference an
+    # np.array(list) conversion pays. The sliced assignments reverse the
+    # snaked rows/columns without allocating a flipped intermediate
+    if isinstance(flattened, np.ndarray):
+        flat = flattened
+    else:
+        flat = np.fromiter(flattened, dtype=dtype, count=M * N)
     if raster_type == "horizontal":
         # Reverse every even row for horizontal snaking
-        array_2d = np.array(flattened).reshape(M, N)
-        array_2d[1::2] = np.fliplr(array_2d[1::2])
+        array_2d = flat.reshape(M, N)
+        array_2d[1::2, :] = array_2d[1::2, ::-1]
     elif raster_type == "vertical":
         # Reverse every even column for vertical snaking
-        array_2d = np.array(flattened).reshape(N, M)
+        array_2d = flat.reshape(N, M)
         array_2d = array_2d.T
-        array_2d[:, 1::2] = np.flipud(array_2d[:, 1::2])
+        array_2d[:, 1::2] = array_2d[::-1, 1::2]
 
     return array_2d
 
@@ -67,15 +76,16 @@ def determine_raster_shape(raster_def):
     Returns the shape and direction of a raster given
     the raster definition
     """
-    if (
-        raster_def["rowDefs"][0]["start"]["y"] == raster_def["rowDefs"][0]["end"]["y"]
-    ):  # this is a horizontal raster
+    # walk the rowDefs dict chain once rather than per field
+    row_defs = raster_def["rowDefs"]
+    first_row = row_defs[0]
+    if first_row["start"]["y"] == first_row["end"]["y"]:  # this is a horizontal raster
         raster_dir = "horizontal"
     else:
         raster_dir = "vertical"
 
-    num_rows = len(raster_def["rowDefs"])
-    num_cols = raster_def["rowDefs"][0]["numsteps"]
+    num_rows = len(row_defs)
+    num_cols = first_row["numsteps"]
     if raster_dir == "vertical":
         num_rows, num_cols = num_cols, num_rows
 
@@ -100,11 +110,9 @@ def get_flattened_indices_of_max_col(raster_def, max_col):
     """
     raster_dir, num_rows, num_cols = determine_raster_shape(raster_def)
 
-    indices = []
-    j = max_col
-    for i in range(num_rows):
-        indices.append(
-            calculate_flattened_index(i, j, num_rows, num_cols, pattern=raster_dir)
-        )
+    rows = np.arange(num_rows)
+    indices = calculate_flattened_index(
+        rows, max_col, num_rows, num_cols, pattern=raster_dir
+    )
 
-    return indices
+    return indices.tolist()